@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field
+from enum import StrEnum
 from typing import Dict, List
 
 
@@ -130,6 +131,9 @@ TOOLS: List[Tool] = [
     ),
 ]
 
+# Closed set of tool names accepted from forms, frozen once at import.
+AITool = StrEnum("AITool", [(tool.name, tool.name) for tool in TOOLS])
+
 
 WORKFLOW: List[WorkflowStep] = [
     WorkflowStep(
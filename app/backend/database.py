@@ -6,7 +6,9 @@ from sqlalchemy.orm import declarative_base, sessionmaker
 DATABASE_URL = "sqlite:///./app.db"
 
 engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    query_cache_size=1200,
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
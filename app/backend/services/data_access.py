@@ -5,14 +5,68 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Callable, Optional, Sequence, Tuple, TypeVar
 
+from sqlalchemy import ColumnElement, Row, case, delete, func, null, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, defer, selectinload
 
 from .. import models
 
 
 T = TypeVar("T")
 
+# Base statements for the listing queries are built once; per-call options and
+# limits are applied generatively and the compiled SQL is reused from the
+# engine's statement cache.
+_RECENT_JOBS_STATEMENT = select(models.Job).order_by(models.Job.created_at.desc())
+_RECENT_MEDIA_STATEMENT = (
+    select(models.JobMedia)
+    .options(selectinload(models.JobMedia.job).selectinload(models.Job.campaign))
+    .order_by(models.JobMedia.created_at.desc())
+)
+_RECENT_POSTS_STATEMENT = select(models.ScheduledPost).order_by(
+    models.ScheduledPost.scheduled_time.desc()
+)
+_RECENT_POST_ROWS_STATEMENT = (
+    select(
+        models.ScheduledPost.id,
+        models.ScheduledPost.title,
+        models.ScheduledPost.content,
+        models.ScheduledPost.video_url,
+        models.ScheduledPost.scheduled_time,
+        models.ScheduledPost.status,
+        models.SocialAccount.display_name.label("account_name"),
+        models.SocialAccount.platform.label("account_platform"),
+    )
+    .outerjoin(models.ScheduledPost.account)
+    .order_by(models.ScheduledPost.scheduled_time.desc())
+)
+# SQL ``trim`` only strips spaces by default; pass the ASCII whitespace that
+# ``str.strip`` removes so the SQL and Python paths agree on padded values.
+_TRIM_CHARACTERS = " \t\n\r\f\v"
+
+
+def _trim(column) -> ColumnElement:
+    return func.trim(column, _TRIM_CHARACTERS)
+
+
+_MEDIA_SOURCE_KIND = case(
+    (func.coalesce(_trim(models.JobMedia.storage_url), "") != "", "storage"),
+    (func.coalesce(_trim(models.JobMedia.media_url), "") != "", "external"),
+    else_="none",
+).label("source_kind")
+
+
+def _minute_display_expression(dialect_name: str, column) -> ColumnElement:
+    """Return a ``YYYY-MM-DD HH:MM`` formatting expression for ``column``."""
+
+    if dialect_name == "sqlite":
+        expression = func.strftime("%Y-%m-%d %H:%M", column)
+    elif dialect_name == "postgresql":
+        expression = func.to_char(column, "YYYY-MM-DD HH24:MI")
+    else:
+        expression = null()
+    return expression.label("created_display")
+
 
 class DatabaseServiceError(RuntimeError):
     """Raised when a database operation fails."""
@@ -32,7 +86,13 @@ class EntityNotFoundError(DatabaseServiceError):
 
 
 class SessionBackedService:
-    """Base class providing error-handled session interactions."""
+    """Base class providing error-handled session interactions.
+
+    Services are built per request around the request's session, so they are
+    slotted to keep that construction to a single small allocation.
+    """
+
+    __slots__ = ("_session",)
 
     def __init__(self, session: Session) -> None:
         self._session = session
@@ -61,6 +121,8 @@ class SessionBackedService:
 class AdminUserService(SessionBackedService):
     """Encapsulate queries related to administrative users."""
 
+    __slots__ = ()
+
     def get_by_username(self, username: str) -> models.AdminUser | None:
         return self._execute(
             lambda session: session.query(models.AdminUser)
@@ -94,12 +156,45 @@ class AdminUserService(SessionBackedService):
 class JobQueryService(SessionBackedService):
     """Read helpers for job entities."""
 
-    def list_recent_jobs(self, *, limit: Optional[int] = None) -> Sequence[models.Job]:
+    __slots__ = ()
+
+    def list_recent_jobs(
+        self,
+        *,
+        limit: Optional[int] = None,
+        eager: Sequence[str] = (),
+    ) -> Sequence[models.Job]:
+        """Return the newest jobs, optionally eager-loading ``eager`` relationships."""
+
         def operation(session: Session) -> Sequence[models.Job]:
-            query = session.query(models.Job).order_by(models.Job.created_at.desc())
+            statement = _RECENT_JOBS_STATEMENT
+            if eager:
+                statement = statement.options(
+                    *(selectinload(getattr(models.Job, name)) for name in eager)
+                )
             if limit is not None:
-                query = query.limit(limit)
-            return query.all()
+                statement = statement.limit(limit)
+            return session.scalars(statement).all()
+
+        return self._execute(operation)
+
+    def list_recent_media_rows(self, *, limit: Optional[int] = None) -> Sequence[Row]:
+        """Return ``(JobMedia, created_display, source_kind)`` rows for the library.
+
+        ``created_display`` is formatted by the database when the dialect
+        supports it (``None`` otherwise) and ``source_kind`` is one of
+        ``"storage"``, ``"external"`` or ``"none"``.
+        """
+
+        def operation(session: Session) -> Sequence[Row]:
+            dialect_name = session.get_bind().dialect.name
+            statement = _RECENT_MEDIA_STATEMENT.add_columns(
+                _minute_display_expression(dialect_name, models.JobMedia.created_at),
+                _MEDIA_SOURCE_KIND,
+            )
+            if limit is not None:
+                statement = statement.limit(limit)
+            return session.execute(statement).all()
 
         return self._execute(operation)
 
@@ -107,16 +202,10 @@ class JobQueryService(SessionBackedService):
         self, *, limit: Optional[int] = None
     ) -> Sequence[models.JobMedia]:
         def operation(session: Session) -> Sequence[models.JobMedia]:
-            query = (
-                session.query(models.JobMedia)
-                .options(
-                    selectinload(models.JobMedia.job).selectinload(models.Job.campaign)
-                )
-                .order_by(models.JobMedia.created_at.desc())
-            )
+            statement = _RECENT_MEDIA_STATEMENT
             if limit is not None:
-                query = query.limit(limit)
-            return query.all()
+                statement = statement.limit(limit)
+            return session.scalars(statement).all()
 
         return self._execute(operation)
 
@@ -124,6 +213,8 @@ class JobQueryService(SessionBackedService):
 class SocialAccountService(SessionBackedService):
     """CRUD helpers for social accounts."""
 
+    __slots__ = ()
+
     def list_accounts_desc(self) -> Sequence[models.SocialAccount]:
         return self._execute(
             lambda session: session.query(models.SocialAccount)
@@ -172,9 +263,19 @@ class SocialAccountService(SessionBackedService):
 class ServiceTokenService(SessionBackedService):
     """Manage service token entities."""
 
+    __slots__ = ()
+
     def list_tokens(self) -> Sequence[models.ServiceToken]:
+        """Return tokens newest first with ``value`` deferred.
+
+        ``ServiceToken`` has no relationships to eager-load; the per-row cost
+        of a listing is decrypting ``value``, which no listing page renders.
+        It is loaded (and decrypted) on first attribute access instead.
+        """
+
         return self._execute(
             lambda session: session.query(models.ServiceToken)
+            .options(defer(models.ServiceToken.value))
             .order_by(models.ServiceToken.created_at.desc())
             .all()
         )
@@ -188,7 +289,13 @@ class ServiceTokenService(SessionBackedService):
         endpoint_url: str | None,
     ) -> Tuple[models.ServiceToken, bool]:
         def operation(session: Session) -> Tuple[models.ServiceToken, bool]:
-            token = session.query(models.ServiceToken).filter_by(key=key).first()
+            # The stored value is overwritten, so skip decrypting it.
+            token = (
+                session.query(models.ServiceToken)
+                .options(defer(models.ServiceToken.value))
+                .filter_by(key=key)
+                .first()
+            )
             created = False
             if token:
                 token.name = name
@@ -209,13 +316,10 @@ class ServiceTokenService(SessionBackedService):
         return self._execute(operation, commit=True)
 
     def delete_token(self, token_id: int) -> bool:
+        statement = delete(models.ServiceToken).where(models.ServiceToken.id == token_id)
+
         def operation(session: Session) -> bool:
-            token = session.get(models.ServiceToken, token_id)
-            if token is None:
-                return False
-            session.delete(token)
-            session.flush()
-            return True
+            return session.execute(statement).rowcount > 0
 
         return self._execute(operation, commit=True)
 
@@ -223,14 +327,39 @@ class ServiceTokenService(SessionBackedService):
 class ScheduledPostService(SessionBackedService):
     """Operations for scheduled posts."""
 
-    def list_recent_posts(self, *, limit: Optional[int] = None) -> Sequence[models.ScheduledPost]:
+    __slots__ = ()
+
+    def list_recent_posts(
+        self, *, limit: Optional[int] = None, load_accounts: bool = True
+    ) -> Sequence[models.ScheduledPost]:
+        """Return posts newest first.
+
+        Pass ``load_accounts=False`` when the accounts are already in the
+        session; ``post.account`` then resolves from the identity map.
+        """
+
         def operation(session: Session) -> Sequence[models.ScheduledPost]:
-            query = session.query(models.ScheduledPost).order_by(
-                models.ScheduledPost.scheduled_time.desc()
-            )
+            statement = _RECENT_POSTS_STATEMENT
+            if load_accounts:
+                statement = statement.options(selectinload(models.ScheduledPost.account))
             if limit is not None:
-                query = query.limit(limit)
-            return query.all()
+                statement = statement.limit(limit)
+            return session.scalars(statement).all()
+
+        return self._execute(operation)
+
+    def list_recent_post_rows(self, *, limit: Optional[int] = None) -> Sequence[Row]:
+        """Return plain column rows for serialising posts without ORM instances.
+
+        Each row carries the post columns plus ``account_name`` and
+        ``account_platform`` (``None`` when the account is missing).
+        """
+
+        def operation(session: Session) -> Sequence[Row]:
+            statement = _RECENT_POST_ROWS_STATEMENT
+            if limit is not None:
+                statement = statement.limit(limit)
+            return session.execute(statement).all()
 
         return self._execute(operation)
 
@@ -258,13 +387,11 @@ class ScheduledPostService(SessionBackedService):
         return self._execute(operation, commit=True)
 
     def delete_post(self, post_id: int) -> bool:
+        # A single primary-key DELETE; ``rowcount`` reports whether it existed.
+        statement = delete(models.ScheduledPost).where(models.ScheduledPost.id == post_id)
+
         def operation(session: Session) -> bool:
-            post = session.get(models.ScheduledPost, post_id)
-            if post is None:
-                return False
-            session.delete(post)
-            session.flush()
-            return True
+            return session.execute(statement).rowcount > 0
 
         return self._execute(operation, commit=True)
 
@@ -21,6 +21,11 @@ try:  # pragma: no cover - optional dependency guard
 except Exception:  # pragma: no cover - fallback when urllib3 missing
     urllib3 = None  # type: ignore[assignment]
 
+try:  # pragma: no cover - optional dependency guard
+    import orjson
+except Exception:  # pragma: no cover - fallback to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
 try:  # pragma: no cover - optional dependency in lightweight environments
     from deep_translator import GoogleTranslator
 except Exception:  # pragma: no cover - graceful degradation if translator missing
@@ -142,7 +147,11 @@ class TextGraphyPlan:
     def lines_json(self) -> str:
         """Return a JSON serialisation usable by the front-end."""
 
-        return json.dumps([line.to_json() for line in self.lines], ensure_ascii=False)
+        payload = [line.to_json() for line in self.lines]
+        if orjson is not None:
+            return orjson.dumps(payload).decode("utf-8")
+        # Compact separators keep the output identical to orjson's.
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
 
 
 @dataclass(slots=True)
@@ -15,6 +15,7 @@ from time import perf_counter
 from fastapi import FastAPI, Request, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 try:  # pragma: no cover - optional dependency in minimal test environments
     from starlette.middleware.sessions import SessionMiddleware
 except ImportError:  # pragma: no cover - fallback when itsdangerous is unavailable
@@ -228,6 +229,9 @@ def create_app() -> FastAPI:
     app.mount("/static", StaticFiles(directory="app/ui/static"), name="static")
 
     templates = Jinja2Templates(directory="app/ui/templates")
+    # The bytecode cache spares each new worker from recompiling the page
+    # templates on its first render.
+    templates.env.bytecode_cache = FileSystemBytecodeCache()
 
     logger.info("Initialising Social Admin FastAPI application")
 
@@ -339,4 +343,8 @@ def create_app() -> FastAPI:
         _initialize_admin_security()
         _schedule_job_reprocessing()
 
+    @app.on_event("shutdown")
+    async def on_shutdown() -> None:
+        await manual_video_presenter.aclose()
+
     return app
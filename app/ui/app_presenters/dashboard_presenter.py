@@ -18,7 +18,7 @@ from app.backend.services.data_access import (
     SocialAccountService,
 )
 
-from .helpers import build_layout_context
+from .helpers import build_layout_context, join_errors
 
 
 @dataclass(slots=True)
@@ -64,8 +64,7 @@ class DashboardPresenter:
             "tokens": tokens,
             "active_page": "dashboard",
         }
-        if error_messages:
-            # Preserve insertion order while removing duplicates
-            unique_messages = list(dict.fromkeys(error_messages))
-            context["error"] = " ".join(unique_messages)
+        error = join_errors(*error_messages)
+        if error:
+            context["error"] = error
         return self.templates.TemplateResponse(request, "dashboard.html", context)
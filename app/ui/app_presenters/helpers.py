@@ -2,15 +2,55 @@
 
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import date, datetime
 from typing import Any, Dict
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.backend import models
 from app.backend.services import permissions as permissions_service
 
+try:  # pragma: no cover - dependency is optional
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the non-native types orjson handles for the stdlib fallback."""
+
+    if is_dataclass(value) and not isinstance(value, type):
+        return {item.name: getattr(value, item.name) for item in fields(value)}
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` encoded with orjson when it is installed.
+
+    Dataclass instances and datetimes may be passed straight through. orjson
+    serialises them natively, and the stdlib fallback mirrors its output, so
+    the wire format does not depend on which encoder is available.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return json.dumps(
+                content,
+                ensure_ascii=False,
+                allow_nan=False,
+                indent=None,
+                separators=(",", ":"),
+                default=_json_default,
+            ).encode("utf-8")
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 
 def is_ajax_request(request: Request) -> bool:
     """Return ``True`` when the incoming request originated from AJAX."""
@@ -22,22 +62,32 @@ def is_ajax_request(request: Request) -> bool:
     return "application/json" in accept_header.lower()
 
 
-def json_success(message: str | None = None, *, status_code: int = 200, **payload: Any) -> JSONResponse:
+def join_errors(*messages: str | None) -> str | None:
+    """Join the distinct, non-empty error messages in order, or return ``None``."""
+
+    seen: list[str] = []
+    for message in messages:
+        if message and message not in seen:
+            seen.append(message)
+    return " ".join(seen) or None
+
+
+def json_success(message: str | None = None, *, status_code: int = 200, **payload: Any) -> FastJSONResponse:
     """Construct a JSON success response with a consistent schema."""
 
     body: Dict[str, Any] = {"success": True}
     if message:
         body["message"] = message
     body.update(payload)
-    return JSONResponse(body, status_code=status_code)
+    return FastJSONResponse(body, status_code=status_code)
 
 
-def json_error(message: str, *, status_code: int = 400, **payload: Any) -> JSONResponse:
+def json_error(message: str, *, status_code: int = 400, **payload: Any) -> FastJSONResponse:
     """Construct a JSON error response with a consistent schema."""
 
     body: Dict[str, Any] = {"success": False, "error": message}
     body.update(payload)
-    return JSONResponse(body, status_code=status_code)
+    return FastJSONResponse(body, status_code=status_code)
 
 
 def build_layout_context(
@@ -58,3 +108,20 @@ def build_layout_context(
     }
     context.update(extra)
     return context
+
+
+@dataclass(slots=True)
+class PageTemplate:
+    """A page template rendered straight to an ``HTMLResponse``.
+
+    Skips the ``TemplateResponse`` plumbing; the context must already contain
+    ``request`` for ``url_for`` to work. The template is looked up on every
+    render so the environment's own cache and ``auto_reload`` still apply.
+    """
+
+    templates: Jinja2Templates
+    name: str
+
+    def render(self, context: Dict[str, Any], *, status_code: int = 200) -> HTMLResponse:
+        template = self.templates.get_template(self.name)
+        return HTMLResponse(template.render(context), status_code=status_code)
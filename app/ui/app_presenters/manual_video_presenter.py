@@ -7,11 +7,12 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
+import os
+import re
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
+from typing import Iterable, NamedTuple, Optional
 
-from fastapi import Request
+from fastapi import BackgroundTasks, Request
 from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
@@ -30,25 +31,25 @@ from app.backend.services.ai_client import (
     dispatch_manual_video_job,
 )
 from app.backend.services.data_access import DatabaseServiceError, JobQueryService
-from app.backend.ai_workflow import TOOLS
+from app.backend.ai_workflow import AITool
 
 try:  # pragma: no cover - optional dependency in minimal test environments
     import httpx
 except Exception:  # pragma: no cover - fallback when httpx unavailable
     httpx = None  # type: ignore[assignment]
 
-from .helpers import is_ajax_request, json_error, json_success
+from .helpers import PageTemplate, is_ajax_request, json_error, json_success
 
 
-@dataclass(frozen=True, slots=True)
-class StatusPresentation:
+class StatusPresentation(NamedTuple):
     label: str
     badge_class: str
     progress_description: str
 
 
-@dataclass(slots=True)
-class ManualVideoJobView:
+class ManualVideoJobView(NamedTuple):
+    """Read-only row rendered in the recent jobs table."""
+
     title: str
     campaign_name: Optional[str]
     ai_tool: str
@@ -120,6 +121,45 @@ DEFAULT_PRESENTATION = StatusPresentation(
 )
 
 
+_STAGE_QUEUED = ("در صف انتظار", "وظیفه در صف پردازش قرار دارد.")
+_STAGE_PREPARING = ("آماده‌سازی", "در حال آماده‌سازی پیش‌نیازهای پردازش ویدیو.")
+_STAGE_RENDERING = ("رندر ویدیو", "ویدیو در حال رندر و ترکیب اجزای مختلف است.")
+_STAGE_UPLOADING = ("بارگذاری", "ویدیو در حال ذخیره‌سازی و بارگذاری در مقصد نهایی است.")
+_STAGE_COMPLETED = ("ویدیو آماده است", "خروجی نهایی با موفقیت ذخیره شد.")
+_STAGE_FAILED = ("پردازش متوقف شد", "برای بررسی بیشتر لاگ‌های سیستم را بررسی کنید.")
+
+# Per status: presentation, fixed stage (``None`` when it depends on
+# progress) and fixed progress (``None`` when the stored value is used).
+_STATUS_DISPATCH: dict[
+    str, tuple[StatusPresentation, Optional[tuple[str, str]], Optional[int]]
+] = {
+    "pending": (STATUS_PRESENTATIONS["pending"], _STAGE_QUEUED, None),
+    "processing": (STATUS_PRESENTATIONS["processing"], None, None),
+    "completed": (STATUS_PRESENTATIONS["completed"], _STAGE_COMPLETED, 100),
+    "failed": (STATUS_PRESENTATIONS["failed"], _STAGE_FAILED, 100),
+}
+_DEFAULT_STATUS_DISPATCH = (DEFAULT_PRESENTATION, _STAGE_QUEUED, None)
+
+
+def _normalize_progress(raw: object) -> int:
+    """Coerce a stored progress value to an int clamped to ``0..100``."""
+
+    if type(raw) is not int:
+        try:
+            raw = int(raw or 0)
+        except (TypeError, ValueError):
+            return 0
+    return 0 if raw < 0 else 100 if raw > 100 else raw
+
+
+def _processing_stage(progress: int) -> tuple[str, str]:
+    if progress < 30:
+        return _STAGE_PREPARING
+    if progress < 70:
+        return _STAGE_RENDERING
+    return _STAGE_UPLOADING
+
+
 SAMPLE_AI_VIDEOS: tuple[SampleAIVideo, ...] = (
     SampleAIVideo(
         title="معرفی محصول جدید",
@@ -145,12 +185,78 @@ SAMPLE_AI_VIDEOS: tuple[SampleAIVideo, ...] = (
 )
 
 
+_PREVIEW_NAME_PATTERN = re.compile(r"^job-(\d+)")
+# An http(s) scheme followed by a non-empty host, without a full urlparse.
+_DOWNLOADABLE_URL_PATTERN = re.compile(r"^https?://[^/?#]", re.IGNORECASE)
+
+_PREVIEW_EXTENSIONS = frozenset({"mp4", "mov", "webm", "m4v", "mkv"})
+
+
+def _preview_suffix(url: str) -> str:
+    """Return the file suffix for a downloaded preview, defaulting to ``.mp4``."""
+
+    path = url.split("?", 1)[0].split("#", 1)[0]
+    _, dot, extension = path.rpartition(".")
+    extension = extension.lower()
+    return f".{extension}" if dot and extension in _PREVIEW_EXTENSIONS else ".mp4"
+
+
+# Preview media (mp4/webm) is already compressed; asking for the identity
+# encoding keeps the CDN from gzipping it and lets us copy raw bytes to disk.
+PREVIEW_DOWNLOAD_HEADERS: dict[str, str] = {"Accept-Encoding": "identity"}
+# Coalesce network reads into 1 MiB writes so large previews need few
+# thread hand-offs and write syscalls.
+PREVIEW_CHUNK_SIZE = 1 << 20
+
+
+# Template context entries shared by every render of the manual video page.
+_BASE_CONTEXT: dict[str, object] = {
+    "active_page": "manual_video",
+    "sample_ai_videos": SAMPLE_AI_VIDEOS,
+}
+
+
 DEFAULT_FORM_CAMPAIGN_NAME = "کمپین معرفی محصول آینده"
 DEFAULT_FORM_CAMPAIGN_DESCRIPTION = (
     "یک کمپین نمونه برای معرفی محصولات جدید با استفاده از ابزارهای هوش مصنوعی."
 )
 
 
+class ManualVideoInputs(NamedTuple):
+    """Stripped form fields for a manual video submission."""
+
+    title: str
+    description: Optional[str]
+    media_url: str
+    media_type: str
+    campaign_name: str
+    campaign_description: Optional[str]
+    ai_tool: str
+
+
+def _normalize_manual_video_inputs(
+    title: str,
+    description: Optional[str],
+    media_url: str,
+    media_type: Optional[str],
+    campaign_name: str,
+    campaign_description: Optional[str],
+    ai_tool: str,
+) -> ManualVideoInputs:
+    """Strip the submitted fields in one place, defaulting the media type."""
+
+    strip = str.strip
+    return ManualVideoInputs(
+        strip(title),
+        strip(description) if description else None,
+        strip(media_url),
+        (strip(media_type) if media_type else "") or "video/mp4",
+        strip(campaign_name),
+        strip(campaign_description) if campaign_description else None,
+        strip(ai_tool),
+    )
+
+
 @dataclass(slots=True)
 class ManualVideoPresenter:
     """Prepare data for manual video creation and handle form submissions."""
@@ -160,8 +266,20 @@ class ManualVideoPresenter:
     static_root: Path = Path("app/ui/static")
     preview_storage_dir: Path = Path("app/ui/static/manual_videos")
     _ai_tools: tuple[str, ...] = field(
-        default_factory=lambda: tuple(tool.name for tool in TOOLS)
+        default_factory=lambda: tuple(tool.value for tool in AITool)
+    )
+    _preview_index: dict[int, tuple[Optional[str], str]] = field(
+        default_factory=dict, repr=False
     )
+    _preview_index_mtime: Optional[int] = field(default=None, repr=False)
+    _download_client: Optional["httpx.AsyncClient"] = field(default=None, repr=False)
+    _ai_tool_set: frozenset[str] = field(init=False, repr=False)
+    _page: PageTemplate = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # The tuple keeps template ordering; the set backs per-request validation.
+        self._ai_tool_set = frozenset(self._ai_tools)
+        self._page = PageTemplate(self.templates, "manual_video.html")
 
     def _build_form_defaults(self) -> ManualVideoFormDefaults:
         """Return default values that pre-populate the manual video form."""
@@ -182,23 +300,6 @@ class ManualVideoPresenter:
             ai_tool=default_tool,
         )
 
-    def _resolve_stage(self, status: str, progress: int) -> tuple[str, str]:
-        normalized_status = (status or "").strip().lower()
-
-        if normalized_status == "completed":
-            return "ویدیو آماده است", "خروجی نهایی با موفقیت ذخیره شد."
-        if normalized_status == "failed":
-            return "پردازش متوقف شد", "برای بررسی بیشتر لاگ‌های سیستم را بررسی کنید."
-
-        if normalized_status == "processing":
-            if progress < 30:
-                return "آماده‌سازی", "در حال آماده‌سازی پیش‌نیازهای پردازش ویدیو."
-            if progress < 70:
-                return "رندر ویدیو", "ویدیو در حال رندر و ترکیب اجزای مختلف است."
-            return "بارگذاری", "ویدیو در حال ذخیره‌سازی و بارگذاری در مقصد نهایی است."
-
-        return "در صف انتظار", "وظیفه در صف پردازش قرار دارد."
-
     def _derive_media_preview_url(self, job: models.Job) -> Optional[str]:
         if not job.media:
             return None
@@ -211,52 +312,95 @@ class ManualVideoPresenter:
                     return trimmed
         return None
 
-    def _find_local_preview(self, job_id: int) -> tuple[Optional[str], Optional[str]]:
-        directory = self.preview_storage_dir
-        if not directory.exists():
-            return None, None
+    def _load_preview_index(self) -> dict[int, tuple[Optional[str], str]]:
+        """Map job ids to ``(web_url, absolute_path)`` of their preview file.
+
+        The directory is rescanned only when its mtime changes.
+        """
 
+        directory = str(self.preview_storage_dir)
         try:
-            candidates = sorted(directory.glob(f"job-{job_id}*"))
+            mtime = os.stat(directory).st_mtime_ns
         except OSError:
-            return None, None
+            return {}
+        if mtime == self._preview_index_mtime:
+            return self._preview_index
 
-        for candidate in candidates:
-            if not candidate.is_file():
+        try:
+            # DirEntry.is_file() reuses the type reported by readdir, so only
+            # symlinked entries cost an extra stat.
+            with os.scandir(directory) as entries:
+                names = sorted(entry.name for entry in entries if entry.is_file())
+        except OSError:
+            return {}
+
+        static_prefix = os.path.join(str(self.static_root), "")
+        absolute_directory = os.path.abspath(directory)
+        index: dict[int, tuple[Optional[str], str]] = {}
+        for name in names:
+            match = _PREVIEW_NAME_PATTERN.match(name)
+            if match is None or name.endswith(".part"):
                 continue
-            try:
-                relative = candidate.relative_to(self.static_root)
-            except ValueError:
-                web_path = None
-            else:
-                web_path = f"/static/{relative.as_posix()}"
-            return web_path, str(candidate.resolve())
+            job_id = int(match.group(1))
+            if job_id in index:
+                continue
+            path = os.path.join(directory, name)
+            web_path = None
+            if path.startswith(static_prefix):
+                relative = path[len(static_prefix):].replace(os.sep, "/")
+                web_path = f"/static/{relative}"
+            index[job_id] = (web_path, os.path.join(absolute_directory, name))
 
-        return None, None
+        self._preview_index = index
+        self._preview_index_mtime = mtime
+        return index
 
-    def _build_job_view(self, job: models.Job) -> ManualVideoJobView:
-        status_raw = (job.status or "").strip().lower()
-        presentation = STATUS_PRESENTATIONS.get(status_raw, DEFAULT_PRESENTATION)
+    def _find_local_preview(self, job_id: int) -> tuple[Optional[str], Optional[str]]:
+        return self._load_preview_index().get(job_id, (None, None))
 
-        progress_value = getattr(job, "progress_percent", 0) or 0
-        try:
-            progress = int(progress_value)
-        except (TypeError, ValueError):  # pragma: no cover - defensive guard
-            progress = 0
-        progress = max(0, min(100, progress))
+    def _find_local_previews_bulk(
+        self, job_ids: Iterable[int]
+    ) -> dict[int, tuple[Optional[str], str]]:
+        """Resolve local previews for many jobs with a single directory check."""
 
-        if status_raw == "completed":
-            progress = 100
-        elif status_raw == "failed" and progress < 100:
-            progress = 100
+        job_ids = list(job_ids)
+        if not job_ids:
+            return {}
+        index = self._load_preview_index()
+        return {job_id: index[job_id] for job_id in job_ids if job_id in index}
+
+    def _build_job_view(
+        self,
+        job: models.Job,
+        *,
+        local_preview: Optional[tuple[Optional[str], Optional[str]]] = None,
+    ) -> ManualVideoJobView:
+        # Statuses are stored normalised, so try the raw value before paying for
+        # strip()/lower().
+        dispatch = _STATUS_DISPATCH.get(job.status) if job.status else None
+        if dispatch is None:
+            dispatch = _STATUS_DISPATCH.get(
+                (job.status or "").strip().lower(), _DEFAULT_STATUS_DISPATCH
+            )
+        presentation, stage, fixed_progress = dispatch
+
+        progress = (
+            fixed_progress
+            if fixed_progress is not None
+            else _normalize_progress(getattr(job, "progress_percent", 0))
+        )
 
         campaign_name = job.campaign.name if job.campaign else None
 
-        stage_label, stage_hint = self._resolve_stage(status_raw, progress)
+        stage_label, stage_hint = (
+            stage if stage is not None else _processing_stage(progress)
+        )
 
         media_preview_url = self._derive_media_preview_url(job)
         local_preview_url, local_preview_path = (None, None)
-        if job.id is not None:
+        if local_preview is not None:
+            local_preview_url, local_preview_path = local_preview
+        elif job.id is not None:
             local_preview_url, local_preview_path = self._find_local_preview(job.id)
 
         error_message: Optional[str] = None
@@ -281,25 +425,25 @@ class ManualVideoPresenter:
         ai_tool_raw = getattr(job, "ai_tool", "") or ""
         ai_tool_value = str(ai_tool_raw).strip()
 
-        if status_raw == "failed" and error_message:
+        if stage is _STAGE_FAILED and error_message:
             stage_hint = error_message
 
         return ManualVideoJobView(
-            title=job.title,
-            campaign_name=campaign_name,
-            ai_tool=ai_tool_value or "نامشخص",
-            status_label=presentation.label,
-            status_badge_class=presentation.badge_class,
-            progress_percent=progress,
-            progress_description=presentation.progress_description,
-            stage_label=stage_label,
-            stage_hint=stage_hint,
-            media_preview_url=media_preview_url,
-            local_preview_url=local_preview_url,
-            local_preview_path=local_preview_path,
-            created_at=job.created_at,
-            error_message=error_message,
-            error_code=error_code,
+            job.title,
+            campaign_name,
+            ai_tool_value or "نامشخص",
+            presentation.label,
+            presentation.badge_class,
+            progress,
+            presentation.progress_description,
+            stage_label,
+            stage_hint,
+            media_preview_url,
+            local_preview_url,
+            local_preview_path,
+            job.created_at,
+            error_message,
+            error_code,
         )
 
     def _load_recent_jobs(
@@ -307,34 +451,96 @@ class ManualVideoPresenter:
     ) -> tuple[list[ManualVideoJobView], str | None]:
         service = JobQueryService(db)
         try:
+            records = service.list_recent_jobs(limit=limit, eager=("campaign", "media"))
+            previews = self._find_local_previews_bulk(
+                record.id for record in records if record.id is not None
+            )
+            build_view = self._build_job_view
+            preview_for = previews.get
+            no_preview = (None, None)
             jobs = [
-                self._build_job_view(job)
-                for job in service.list_recent_jobs(limit=limit)
+                build_view(record, local_preview=preview_for(record.id, no_preview))
+                for record in records
             ]
             return jobs, None
         except DatabaseServiceError as exc:
             self.logger.error("Failed to load recent jobs", exc_info=exc)
             return [], "بارگذاری لیست وظایف با خطا مواجه شد."
 
+    def _jobs_for_request(
+        self, request: Request, db: Session
+    ) -> tuple[list[ManualVideoJobView], str | None]:
+        """Load recent jobs at most once per request, caching on ``request.state``."""
+
+        cached = getattr(request.state, "manual_video_jobs", None)
+        if cached is None:
+            cached = self._load_recent_jobs(db)
+            request.state.manual_video_jobs = cached
+        return cached
+
     def render(self, request: Request, user: models.AdminUser, db: Session) -> object:
-        jobs, load_error = self._load_recent_jobs(db)
-        context = {
+        jobs, load_error = self._jobs_for_request(request, db)
+        context = self._base_context(request, user, jobs)
+        if load_error:
+            context["error"] = load_error
+        return self._page.render(context)
+
+    def _base_context(
+        self, request: Request, user: models.AdminUser, jobs: list[ManualVideoJobView]
+    ) -> dict[str, object]:
+        """Return the template context shared by the page and its error responses."""
+
+        return {
+            **_BASE_CONTEXT,
             "request": request,
             "user": user,
             "jobs": jobs,
-            "active_page": "manual_video",
             "ai_tools": self._ai_tools,
-            "sample_ai_videos": SAMPLE_AI_VIDEOS,
             "manual_video_defaults": self._build_form_defaults(),
         }
+
+    def _form_error_response(
+        self, request: Request, db: Session, user: models.AdminUser, error_message: str
+    ) -> object:
+        """Render a rejected submission as JSON for AJAX callers or as the page."""
+
+        jobs, load_error = self._jobs_for_request(request, db)
+        if is_ajax_request(request):
+            payload: dict[str, object] = {}
+            if load_error:
+                payload["warning"] = load_error
+            return json_error(error_message, status_code=400, **payload)
+        context = self._base_context(request, user, jobs)
+        context["error"] = error_message
         if load_error:
-            context["error"] = load_error
-        return self.templates.TemplateResponse(request, "manual_video.html", context)
+            context["load_error"] = load_error
+        return self._page.render(context, status_code=400)
 
     @staticmethod
     def _should_download_media(url: str) -> bool:
-        parsed = urlparse(url)
-        return parsed.scheme in {"http", "https"} and bool(parsed.netloc)
+        return _DOWNLOADABLE_URL_PATTERN.match(url) is not None
+
+    def _get_download_client(self) -> "httpx.AsyncClient":
+        """Return the pooled client used for preview downloads, creating it lazily."""
+
+        if self._download_client is None:
+            self._download_client = httpx.AsyncClient(
+                timeout=15,
+                transport=httpx.AsyncHTTPTransport(
+                    retries=2,
+                    limits=httpx.Limits(
+                        max_connections=16, max_keepalive_connections=4
+                    ),
+                ),
+            )
+        return self._download_client
+
+    async def aclose(self) -> None:
+        """Release pooled connections held for preview downloads."""
+
+        if self._download_client is not None:
+            await self._download_client.aclose()
+            self._download_client = None
 
     async def _download_manual_video_preview(self, url: str, *, job_id: int) -> Optional[Path]:
         if httpx is None:
@@ -344,17 +550,40 @@ class ManualVideoPresenter:
             )
             return None
 
+        suffix = _preview_suffix(url)
+        target_dir = self.preview_storage_dir
+        target_dir.mkdir(parents=True, exist_ok=True)
+        target_path = target_dir / f"job-{job_id}{suffix}"
+        # Stream under a ``.part`` name so the preview index never picks up a
+        # half-written file; it is renamed into place once complete.
+        partial_path = target_path.with_suffix(f"{suffix}.part")
+
         started_at = log_request_start(
             "GET",
             url,
             job_id=job_id,
             purpose="manual_video_preview",
         )
-        response: httpx.Response | None = None
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                response = await client.get(url)
+            client = self._get_download_client()
+            async with client.stream(
+                "GET", url, headers=PREVIEW_DOWNLOAD_HEADERS
+            ) as response:
                 response.raise_for_status()
+                try:
+                    await self._stream_preview_to_disk(response, partial_path)
+                    await asyncio.to_thread(os.replace, partial_path, target_path)
+                except OSError as exc:
+                    self.logger.error(
+                        "Failed to persist manual video preview",
+                        extra={
+                            "url": url,
+                            "destination": str(target_path),
+                            "error": str(exc),
+                        },
+                    )
+                    partial_path.unlink(missing_ok=True)
+                    return None
             log_request_success(
                 "GET",
                 url,
@@ -376,29 +605,41 @@ class ManualVideoPresenter:
                 "Failed to download manual video preview",
                 extra={"url": url, "error": str(exc)},
             )
+            partial_path.unlink(missing_ok=True)
             return None
 
-        parsed = urlparse(url)
-        suffix = Path(parsed.path).suffix or ".mp4"
-        target_dir = self.preview_storage_dir
-        target_dir.mkdir(parents=True, exist_ok=True)
-        target_path = target_dir / f"job-{job_id}{suffix}"
+        return target_path
 
+    @staticmethod
+    async def _stream_preview_to_disk(response: "httpx.Response", target_path: Path) -> None:
+        """Write the undecoded response body to ``target_path`` chunk by chunk.
+
+        The buffered writer is kept because, unlike a raw ``FileIO``, its
+        ``write`` never returns after a short write.
+        """
+
+        handle = await asyncio.to_thread(target_path.open, "wb")
         try:
-            if response is not None:
-                content = await response.aread()
-                await asyncio.to_thread(target_path.write_bytes, content)
-        except Exception as exc:  # pragma: no cover - defensive for IO errors
-            self.logger.error(
-                "Failed to persist manual video preview",
-                extra={"url": url, "destination": str(target_path), "error": str(exc)},
-            )
-            return None
+            async for chunk in response.aiter_raw(chunk_size=PREVIEW_CHUNK_SIZE):
+                await asyncio.to_thread(handle.write, chunk)
         finally:
-            if response is not None:
-                await response.aclose()
+            await asyncio.to_thread(handle.close)
 
-        return target_path
+    async def _save_manual_video_preview(
+        self, url: str, *, job_id: int, user_id: int
+    ) -> None:
+        """Download a preview after the response has been sent to the client."""
+
+        local_path = await self._download_manual_video_preview(url, job_id=job_id)
+        if local_path:
+            self.logger.info(
+                "Manual video preview saved locally",
+                extra={
+                    "user_id": user_id,
+                    "job_id": job_id,
+                    "local_path": str(local_path),
+                },
+            )
 
     async def _dispatch_manual_job_to_ai(
         self,
@@ -459,6 +700,7 @@ class ManualVideoPresenter:
         request: Request,
         db: Session,
         user: models.AdminUser,
+        background_tasks: BackgroundTasks,
         title: str,
         description: Optional[str],
         media_url: str,
@@ -467,17 +709,24 @@ class ManualVideoPresenter:
         campaign_description: Optional[str],
         ai_tool: str,
     ) -> RedirectResponse | object:
-        clean_title = title.strip()
-        clean_media_url = media_url.strip()
-        clean_campaign_name = campaign_name.strip()
-        clean_media_type = (media_type or "video/mp4").strip() or "video/mp4"
-        clean_description = description.strip() if description else None
-        clean_campaign_description = (
-            campaign_description.strip() if campaign_description else None
+        (
+            clean_title,
+            clean_description,
+            clean_media_url,
+            clean_media_type,
+            clean_campaign_name,
+            clean_campaign_description,
+            clean_ai_tool,
+        ) = _normalize_manual_video_inputs(
+            title,
+            description,
+            media_url,
+            media_type,
+            campaign_name,
+            campaign_description,
+            ai_tool,
         )
-        clean_ai_tool = ai_tool.strip()
 
-        jobs, load_error = self._load_recent_jobs(db)
         if (
             not clean_title
             or not clean_media_url
@@ -489,47 +738,11 @@ class ManualVideoPresenter:
                 error_message = (
                     "عنوان، لینک ویدیو، نام کمپین و نام ابزار هوش مصنوعی الزامی هستند."
                 )
-            context = {
-                "request": request,
-                "user": user,
-                "jobs": jobs,
-                "error": error_message,
-                "active_page": "manual_video",
-                "ai_tools": self._ai_tools,
-                "sample_ai_videos": SAMPLE_AI_VIDEOS,
-                "manual_video_defaults": self._build_form_defaults(),
-            }
-            if load_error:
-                context.setdefault("load_error", load_error)
-            if is_ajax_request(request):
-                payload: dict[str, object] = {}
-                if load_error:
-                    payload["warning"] = load_error
-                return json_error(error_message, status_code=400, **payload)
-            return self.templates.TemplateResponse(
-                request, "manual_video.html", context, status_code=400
-            )
+            return self._form_error_response(request, db, user, error_message)
 
-        if clean_ai_tool not in self._ai_tools:
-            context = {
-                "request": request,
-                "user": user,
-                "jobs": jobs,
-                "error": "ابزار هوش مصنوعی انتخاب‌شده معتبر نیست.",
-                "active_page": "manual_video",
-                "ai_tools": self._ai_tools,
-                "sample_ai_videos": SAMPLE_AI_VIDEOS,
-                "manual_video_defaults": self._build_form_defaults(),
-            }
-            if load_error:
-                context.setdefault("load_error", load_error)
-            if is_ajax_request(request):
-                payload: dict[str, object] = {}
-                if load_error:
-                    payload["warning"] = load_error
-                return json_error("ابزار هوش مصنوعی انتخاب‌شده معتبر نیست.", status_code=400, **payload)
-            return self.templates.TemplateResponse(
-                request, "manual_video.html", context, status_code=400
+        if clean_ai_tool not in self._ai_tool_set:
+            return self._form_error_response(
+                request, db, user, "ابزار هوش مصنوعی انتخاب‌شده معتبر نیست."
             )
 
         job = None
@@ -558,43 +771,20 @@ class ManualVideoPresenter:
             self.logger.warning(
                 "Validation error while creating manual video", extra={"error": str(exc)}
             )
-            jobs, load_error = self._load_recent_jobs(db)
-            error_message = "ثبت ویدیو با خطا مواجه شد: " + str(exc)
-            context = {
-                "request": request,
-                "user": user,
-                "jobs": jobs,
-                "error": error_message,
-                "active_page": "manual_video",
-                "ai_tools": self._ai_tools,
-                "sample_ai_videos": SAMPLE_AI_VIDEOS,
-                "manual_video_defaults": self._build_form_defaults(),
-            }
-            if load_error:
-                context.setdefault("load_error", load_error)
-            if is_ajax_request(request):
-                payload: dict[str, object] = {}
-                if load_error:
-                    payload["warning"] = load_error
-                return json_error(error_message, status_code=400, **payload)
-            return self.templates.TemplateResponse(
-                request, "manual_video.html", context, status_code=400
+            return self._form_error_response(
+                request, db, user, "ثبت ویدیو با خطا مواجه شد: " + str(exc)
             )
 
+        preview_scheduled = False
         if job and job.id:
             if self._should_download_media(clean_media_url):
-                local_path = await self._download_manual_video_preview(
-                    clean_media_url, job_id=job.id
+                preview_scheduled = True
+                background_tasks.add_task(
+                    self._save_manual_video_preview,
+                    clean_media_url,
+                    job_id=job.id,
+                    user_id=user.id,
                 )
-                if local_path:
-                    self.logger.info(
-                        "Manual video preview saved locally",
-                        extra={
-                            "user_id": user.id,
-                            "job_id": job.id,
-                            "local_path": str(local_path),
-                        },
-                    )
 
             await self._dispatch_manual_job_to_ai(
                 job_id=job.id,
@@ -608,15 +798,19 @@ class ManualVideoPresenter:
                 ai_tool=clean_ai_tool,
             )
 
-        self.logger.info(
-            "Manual video job created",
-            extra={
-                "user_id": user.id,
-                "title": clean_title,
-                "campaign": clean_campaign_name,
-                "ai_tool": clean_ai_tool,
-            },
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Manual video job created",
+                extra={
+                    "user_id": user.id,
+                    "job_id": job.id if job else None,
+                    "title": clean_title,
+                    "campaign": clean_campaign_name,
+                    "ai_tool": clean_ai_tool,
+                    "media_url": clean_media_url,
+                    "preview_download_scheduled": preview_scheduled,
+                },
+            )
         if is_ajax_request(request):
             payload: dict[str, object] = {"redirect": "/manual-video"}
             if job and job.id:
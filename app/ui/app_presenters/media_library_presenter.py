@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import starmap
 from typing import Optional, Sequence
 
 from fastapi import Request
@@ -14,7 +16,32 @@ from sqlalchemy.orm import Session
 from app.backend import models
 from app.backend.services.data_access import DatabaseServiceError, JobQueryService
 
-from .helpers import build_layout_context
+from .helpers import PageTemplate, build_layout_context
+
+# Keyed by the ``source_kind`` column computed in ``list_recent_media_rows``.
+_SOURCE_LABELS = {
+    "storage": "ذخیره شده در فضای داخلی",
+    "external": "لینک خارجی ثبت‌شده",
+    "none": "بدون لینک ثبت‌شده",
+}
+
+_TYPE_CATEGORY = {"video": "video", "image": "image", "audio": "audio"}
+_EXTENSION_CATEGORY = {
+    **dict.fromkeys(("mp4", "mov", "mkv", "webm"), "video"),
+    **dict.fromkeys(("jpg", "jpeg", "png", "gif", "webp"), "image"),
+    **dict.fromkeys(("mp3", "wav", "ogg", "m4a"), "audio"),
+}
+
+
+def _infer_category(media_type: str, preview_url: Optional[str]) -> str:
+    """Classify a media row from its (already stripped) MIME type or URL suffix."""
+
+    category = _TYPE_CATEGORY.get(media_type.split("/", 1)[0].lower())
+    if category is not None:
+        return category
+    if preview_url and "." in preview_url:
+        return _EXTENSION_CATEGORY.get(preview_url.rpartition(".")[2].lower(), "other")
+    return "other"
 
 
 @dataclass(slots=True)
@@ -46,15 +73,99 @@ class MediaSummary:
     other: int
 
 
+def _clean(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    cleaned = str(value).strip()
+    return cleaned or None
+
+
+def _select_preview_url(media: models.JobMedia) -> Optional[str]:
+    return _clean(media.storage_url) or _clean(media.media_url)
+
+
+def _derive_title(media: models.JobMedia) -> str:
+    title = _clean(media.job_name) or _clean(media.storage_key)
+    if title:
+        return title
+    job = media.job
+    title = _clean(job.title) if job is not None else None
+    if title:
+        return title
+    media_id = media.id
+    return f"رسانه شماره {media_id}" if media_id else "رسانه ثبت‌شده"
+
+
+def _source_label(media: models.JobMedia) -> str:
+    if _clean(media.storage_url):
+        return _SOURCE_LABELS["storage"]
+    if _clean(media.media_url):
+        return _SOURCE_LABELS["external"]
+    return _SOURCE_LABELS["none"]
+
+
+def _build_media_view(
+    media: models.JobMedia,
+    created_display: Optional[str] = None,
+    source_kind: Optional[str] = None,
+) -> MediaAssetView:
+    """Convert one media row into its template view.
+
+    The per-row helpers are module functions rather than presenter methods so
+    the listing loop resolves them as globals instead of bound methods.
+    """
+
+    preview_url = _select_preview_url(media)
+    media_type = _clean(media.media_type) or ""
+    created_at = media.created_at
+    if created_display is None:
+        created_display = (
+            created_at.strftime("%Y-%m-%d %H:%M")
+            if isinstance(created_at, datetime)
+            else ""
+        )
+    # ``job`` and ``job.campaign`` are selectin-loaded by the listing query.
+    job = media.job
+    job_id = job_title = job_status = campaign_name = None
+    if job is not None:
+        job_id = job.id
+        job_title = _clean(job.title)
+        job_status = _clean(job.status)
+        if job.campaign is not None:
+            campaign_name = _clean(job.campaign.name)
+    source_label = (
+        _SOURCE_LABELS[source_kind]
+        if source_kind in _SOURCE_LABELS
+        else _source_label(media)
+    )
+
+    return MediaAssetView(
+        id=media.id or 0,
+        title=_derive_title(media),
+        media_type=media_type,
+        category=_infer_category(media_type, preview_url),
+        preview_url=preview_url,
+        created_at=created_at,
+        created_display=created_display,
+        job_id=job_id,
+        job_title=job_title,
+        job_status=job_status,
+        campaign_name=campaign_name,
+        source_label=source_label,
+    )
+
+
 @dataclass(slots=True)
 class MediaLibraryPresenter:
     """Prepare data required to render the media library page."""
 
     templates: Jinja2Templates
-    logger: logging.Logger = field(
-        default_factory=lambda: logging.getLogger("app.ui.media_library")
-    )
+    logger: logging.Logger = logging.getLogger("app.ui.media_library")
     default_limit: int = 60
+    _page: PageTemplate = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._page = PageTemplate(self.templates, "media_library.html")
 
     def render(self, request: Request, user: models.AdminUser, db: Session) -> object:
         items, error = self._load_media(db)
@@ -71,118 +182,26 @@ class MediaLibraryPresenter:
             context["error"] = error
         elif not items:
             context["info"] = "هنوز رسانه‌ای در سیستم ثبت نشده است."
-        return self.templates.TemplateResponse(request, "media_library.html", context)
+        return self._page.render(context)
 
     def _load_media(self, db: Session) -> tuple[list[MediaAssetView], Optional[str]]:
         service = JobQueryService(db)
         try:
-            records: Sequence[models.JobMedia] = service.list_recent_media(
-                limit=self.default_limit
-            )
+            rows = service.list_recent_media_rows(limit=self.default_limit)
         except DatabaseServiceError as exc:
             self.logger.error("Failed to load media assets", exc_info=exc)
             return [], "بارگذاری رسانه‌ها با خطا مواجه شد."
 
-        items = [self._build_media_view(record) for record in records]
-        return items, None
-
-    def _build_media_view(self, media: models.JobMedia) -> MediaAssetView:
-        preview_url = self._select_preview_url(media)
-        category = self._infer_category(media.media_type, preview_url)
-        title = self._derive_title(media)
-        created_at = getattr(media, "created_at", None)
-        created_display = (
-            created_at.strftime("%Y-%m-%d %H:%M") if isinstance(created_at, datetime) else ""
-        )
-        job = getattr(media, "job", None)
-        job_id = getattr(job, "id", None)
-        job_title = self._clean(getattr(job, "title", None))
-        job_status = self._clean(getattr(job, "status", None))
-        campaign_name = None
-        if job and getattr(job, "campaign", None):
-            campaign_name = self._clean(getattr(job.campaign, "name", None))
-        source_label = self._source_label(media)
-
-        return MediaAssetView(
-            id=getattr(media, "id", 0) or 0,
-            title=title,
-            media_type=self._clean(media.media_type) or "",
-            category=category,
-            preview_url=preview_url,
-            created_at=created_at,
-            created_display=created_display,
-            job_id=job_id,
-            job_title=job_title,
-            job_status=job_status,
-            campaign_name=campaign_name,
-            source_label=source_label,
-        )
-
-    def _select_preview_url(self, media: models.JobMedia) -> Optional[str]:
-        for attribute in ("storage_url", "media_url"):
-            value = self._clean(getattr(media, attribute, None))
-            if value:
-                return value
-        return None
-
-    def _infer_category(
-        self, media_type: Optional[str], preview_url: Optional[str]
-    ) -> str:
-        media_type_value = (media_type or "").strip().lower()
-        if media_type_value.startswith("video"):
-            return "video"
-        if media_type_value.startswith("image"):
-            return "image"
-        if media_type_value.startswith("audio"):
-            return "audio"
-
-        if preview_url:
-            lowered = preview_url.lower()
-            if lowered.endswith((".mp4", ".mov", ".mkv", ".webm")):
-                return "video"
-            if lowered.endswith((".jpg", ".jpeg", ".png", ".gif", ".webp")):
-                return "image"
-            if lowered.endswith((".mp3", ".wav", ".ogg", ".m4a")):
-                return "audio"
-        return "other"
-
-    def _derive_title(self, media: models.JobMedia) -> str:
-        for candidate in (
-            self._clean(getattr(media, "job_name", None)),
-            self._clean(getattr(media, "storage_key", None)),
-        ):
-            if candidate:
-                return candidate
-        job = getattr(media, "job", None)
-        title = self._clean(getattr(job, "title", None)) if job else None
-        if title:
-            return title
-        media_id = getattr(media, "id", None)
-        return f"رسانه شماره {media_id}" if media_id else "رسانه ثبت‌شده"
-
-    def _source_label(self, media: models.JobMedia) -> str:
-        if self._clean(getattr(media, "storage_url", None)):
-            return "ذخیره شده در فضای داخلی"
-        if self._clean(getattr(media, "media_url", None)):
-            return "لینک خارجی ثبت‌شده"
-        return "بدون لینک ثبت‌شده"
+        # Rows are ``(media, created_display, source_kind)`` tuples, so they
+        # feed the builder positionally in a single pass.
+        return list(starmap(_build_media_view, rows)), None
 
     def _summarise(self, items: Sequence[MediaAssetView]) -> MediaSummary:
-        summary = MediaSummary(total=len(items), video=0, image=0, audio=0, other=0)
-        for item in items:
-            if item.category == "video":
-                summary.video += 1
-            elif item.category == "image":
-                summary.image += 1
-            elif item.category == "audio":
-                summary.audio += 1
-            else:
-                summary.other += 1
-        return summary
-
-    @staticmethod
-    def _clean(value: Optional[str]) -> Optional[str]:
-        if value is None:
-            return None
-        cleaned = str(value).strip()
-        return cleaned or None
+        counts = Counter(item.category for item in items)
+        return MediaSummary(
+            total=len(items),
+            video=counts["video"],
+            image=counts["image"],
+            audio=counts["audio"],
+            other=len(items) - counts["video"] - counts["image"] - counts["audio"],
+        )
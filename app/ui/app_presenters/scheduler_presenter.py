@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 
 from fastapi import Request
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
 from app.backend import models
@@ -19,7 +21,63 @@ from app.backend.services.data_access import (
     SocialAccountService,
 )
 
-from .helpers import is_ajax_request
+from .helpers import FastJSONResponse, PageTemplate, is_ajax_request, join_errors
+
+
+def _norm(value: Optional[str]) -> Optional[str]:
+    """Strip an optional form field, mapping blank input to ``None``."""
+
+    return (value.strip() or None) if value else None
+
+
+# ``datetime-local`` inputs send ``YYYY-MM-DDTHH:MM``; seconds, fractions, an
+# offset or a trailing ``Z`` (dropped, as the database stores naive values) are
+# also accepted. Anything else is rejected before ``fromisoformat`` is tried.
+_SCHEDULE_TIME_RE = re.compile(
+    r"(\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:[+-]\d{2}:\d{2})?)?)Z?"
+)
+
+
+def _parse_schedule_time(value: str) -> Optional[datetime]:
+    """Parse a submitted schedule time, returning ``None`` when it is invalid."""
+
+    match = _SCHEDULE_TIME_RE.fullmatch(value.strip())
+    if match is None:
+        return None
+    try:
+        # Well-formed but out-of-range values such as month 13 still raise.
+        return datetime.fromisoformat(match.group(1))
+    except ValueError:
+        return None
+
+
+def _format_schedule_display(value: datetime) -> str:
+    """Format as ``%Y-%m-%d %H:%M`` without strftime's format parsing."""
+
+    return (
+        f"{value.year:04d}-{value.month:02d}-{value.day:02d} "
+        f"{value.hour:02d}:{value.minute:02d}"
+    )
+
+
+@dataclass(slots=True)
+class ScheduledPostPayload:
+    """One scheduled post as sent to the scheduler's AJAX client.
+
+    ``FastJSONResponse`` serialises the instance and its ``scheduled_time``
+    directly, so no per-post ``dict`` or ``isoformat`` call is needed.
+    """
+
+    id: int
+    title: str
+    account: str
+    account_platform: str
+    scheduled_time: Optional[datetime]
+    scheduled_time_display: str
+    status: str
+    video_url: str
+    content: str
+
 
 @dataclass(slots=True)
 class SchedulerPresenter:
@@ -27,6 +85,10 @@ class SchedulerPresenter:
 
     templates: Jinja2Templates
     logger: logging.Logger = logging.getLogger("app.ui.scheduler")
+    _page: PageTemplate = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._page = PageTemplate(self.templates, "scheduler.html")
 
     @staticmethod
     def _is_ajax(request: Request) -> bool:
@@ -43,57 +105,125 @@ class SchedulerPresenter:
             self.logger.error("Failed to load accounts for scheduler", exc_info=exc)
             return [], "بارگذاری حساب‌ها با خطا مواجه شد."
 
-    def _load_posts(self, db: Session) -> tuple[list[models.ScheduledPost], str | None]:
+    def _load_posts(
+        self, db: Session, *, load_accounts: bool = True
+    ) -> tuple[list[models.ScheduledPost], str | None]:
         service = ScheduledPostService(db)
         try:
-            posts = list(service.list_recent_posts())
+            posts = list(service.list_recent_posts(load_accounts=load_accounts))
             return posts, None
         except DatabaseServiceError as exc:
             self.logger.error("Failed to load scheduled posts", exc_info=exc)
             return [], "بارگذاری پست‌های زمان‌بندی شده با خطا مواجه شد."
 
+    def _load_post_rows(self, db: Session) -> tuple[list[Row], str | None]:
+        service = ScheduledPostService(db)
+        try:
+            return list(service.list_recent_post_rows()), None
+        except DatabaseServiceError as exc:
+            self.logger.error("Failed to load scheduled posts", exc_info=exc)
+            return [], "بارگذاری پست‌های زمان‌بندی شده با خطا مواجه شد."
+
+    def _posts_payload(
+        self, db: Session, *, success: bool, status_code: int, **fields: object
+    ) -> FastJSONResponse:
+        """Build an AJAX response carrying the refreshed post list."""
+
+        rows, post_error = self._load_post_rows(db)
+        payload: dict[str, object] = {
+            "success": success,
+            **fields,
+            "posts": self._serialize_posts(rows),
+        }
+        if post_error:
+            payload["warning"] = post_error
+        return FastJSONResponse(payload, status_code=status_code)
+
+    def _load_scheduler_bundle(
+        self, db: Session
+    ) -> tuple[list[models.SocialAccount], list[models.ScheduledPost], str | None]:
+        """Load accounts and posts together, returning any combined load error.
+
+        Accounts are loaded first so each ``post.account`` is served from the
+        session's identity map rather than a separate account query.
+        """
+
+        accounts, account_error = self._load_accounts(db)
+        posts, post_error = self._load_posts(db, load_accounts=account_error is not None)
+        return accounts, posts, join_errors(account_error, post_error)
+
+    @staticmethod
+    def _build_context(
+        request: Request,
+        user: models.AdminUser,
+        accounts: list[models.SocialAccount],
+        posts: list[models.ScheduledPost],
+    ) -> dict[str, object]:
+        return {
+            "request": request,
+            "user": user,
+            "accounts": accounts,
+            "posts": posts,
+            "active_page": "scheduler",
+        }
+
+    def _schedule_error_response(
+        self,
+        request: Request,
+        db: Session,
+        user: models.AdminUser,
+        error_message: str,
+        *,
+        status_code: int,
+    ) -> object:
+        """Respond to a failed mutation with fresh scheduler data."""
+
+        if self._is_ajax(request):
+            return self._posts_payload(
+                db, success=False, status_code=status_code, error=error_message
+            )
+        accounts, posts, load_error = self._load_scheduler_bundle(db)
+        context = self._build_context(request, user, accounts, posts)
+        context["error"] = error_message
+        if load_error:
+            context["load_error"] = load_error
+        return self._page.render(context, status_code=status_code)
+
     @staticmethod
-    def _serialize_posts(posts: list[models.ScheduledPost]) -> list[dict[str, object]]:
-        """Convert post models into JSON serialisable dictionaries."""
+    def _serialize_posts(posts: Sequence[Row]) -> list[ScheduledPostPayload]:
+        """Convert ``list_recent_post_rows`` rows into JSON payload objects."""
 
-        serialised: list[dict[str, object]] = []
+        serialised: list[ScheduledPostPayload] = []
         for post in posts:
             account_name = "-"
             account_platform = ""
-            if post.account:
-                account_name = post.account.display_name
-                account_platform = post.account.platform
+            if post.account_name is not None:
+                account_name = post.account_name
+                account_platform = post.account_platform
+            scheduled_time = post.scheduled_time
             serialised.append(
-                {
-                    "id": post.id,
-                    "title": post.title,
-                    "account": account_name,
-                    "account_platform": account_platform,
-                    "scheduled_time": post.scheduled_time.isoformat() if post.scheduled_time else "",
-                    "scheduled_time_display": post.scheduled_time.strftime("%Y-%m-%d %H:%M")
-                    if post.scheduled_time
-                    else "",
-                    "status": post.status or "pending",
-                    "video_url": post.video_url or "",
-                    "content": post.content or "",
-                }
+                ScheduledPostPayload(
+                    id=post.id,
+                    title=post.title,
+                    account=account_name,
+                    account_platform=account_platform,
+                    scheduled_time=scheduled_time,
+                    scheduled_time_display=(
+                        _format_schedule_display(scheduled_time) if scheduled_time else ""
+                    ),
+                    status=post.status or "pending",
+                    video_url=post.video_url or "",
+                    content=post.content or "",
+                )
             )
         return serialised
 
     def render(self, request: Request, user: models.AdminUser, db: Session) -> object:
-        accounts, account_error = self._load_accounts(db)
-        posts, post_error = self._load_posts(db)
-        errors = [msg for msg in (account_error, post_error) if msg]
-        context = {
-            "request": request,
-            "user": user,
-            "accounts": accounts,
-            "posts": posts,
-            "active_page": "scheduler",
-        }
-        if errors:
-            context["error"] = " ".join(dict.fromkeys(errors))
-        return self.templates.TemplateResponse(request, "scheduler.html", context)
+        accounts, posts, load_error = self._load_scheduler_bundle(db)
+        context = self._build_context(request, user, accounts, posts)
+        if load_error:
+            context["error"] = load_error
+        return self._page.render(context)
 
     def create_schedule(
         self,
@@ -107,44 +237,18 @@ class SchedulerPresenter:
         video_url: Optional[str],
         scheduled_time: str,
     ) -> RedirectResponse | object:
-        raw_time = scheduled_time.strip()
-        if raw_time.endswith("Z"):
-            raw_time = raw_time[:-1]
-        try:
-            schedule_dt = datetime.fromisoformat(raw_time)
-        except ValueError:
-            accounts, account_error = self._load_accounts(db)
-            posts, post_error = self._load_posts(db)
+        schedule_dt = _parse_schedule_time(scheduled_time)
+        if schedule_dt is None:
             self.logger.warning(
                 "Invalid schedule timestamp provided",
                 extra={"user_id": user.id, "account_id": account_id, "value": scheduled_time},
             )
-            context = {
-                "request": request,
-                "user": user,
-                "accounts": accounts,
-                "posts": posts,
-                "error": "فرمت تاریخ/زمان نامعتبر است.",
-                "active_page": "scheduler",
-            }
-            extra_errors = [msg for msg in (account_error, post_error) if msg]
-            if extra_errors:
-                context.setdefault("load_error", " ".join(dict.fromkeys(extra_errors)))
-            if self._is_ajax(request):
-                payload = {
-                    "success": False,
-                    "error": "فرمت تاریخ/زمان نامعتبر است.",
-                    "posts": self._serialize_posts(posts),
-                }
-                if extra_errors:
-                    payload["warning"] = " ".join(dict.fromkeys(extra_errors))
-                return JSONResponse(payload, status_code=400)
-            return self.templates.TemplateResponse(
-                request, "scheduler.html", context, status_code=400
+            return self._schedule_error_response(
+                request, db, user, "فرمت تاریخ/زمان نامعتبر است.", status_code=400
             )
 
-        text_content = content.strip() or None if content else None
-        video_link = video_url.strip() or None if video_url else None
+        text_content = _norm(content)
+        video_link = _norm(video_url)
 
         service = ScheduledPostService(db)
         try:
@@ -161,30 +265,8 @@ class SchedulerPresenter:
                 extra={"user_id": user.id, "account_id": account_id},
                 exc_info=exc,
             )
-            accounts, account_error = self._load_accounts(db)
-            posts, post_error = self._load_posts(db)
-            context = {
-                "request": request,
-                "user": user,
-                "accounts": accounts,
-                "posts": posts,
-                "error": "ثبت برنامه انتشار با خطا مواجه شد.",
-                "active_page": "scheduler",
-            }
-            extra_errors = [msg for msg in (account_error, post_error) if msg]
-            if extra_errors:
-                context.setdefault("load_error", " ".join(dict.fromkeys(extra_errors)))
-            if self._is_ajax(request):
-                payload = {
-                    "success": False,
-                    "error": "ثبت برنامه انتشار با خطا مواجه شد.",
-                    "posts": self._serialize_posts(posts),
-                }
-                if extra_errors:
-                    payload["warning"] = " ".join(dict.fromkeys(extra_errors))
-                return JSONResponse(payload, status_code=500)
-            return self.templates.TemplateResponse(
-                request, "scheduler.html", context, status_code=500
+            return self._schedule_error_response(
+                request, db, user, "ثبت برنامه انتشار با خطا مواجه شد.", status_code=500
             )
 
         self.logger.info(
@@ -196,16 +278,10 @@ class SchedulerPresenter:
                 "scheduled_time": schedule_dt.isoformat(),
             },
         )
-        posts, post_error = self._load_posts(db)
         if self._is_ajax(request):
-            payload: dict[str, object] = {
-                "success": True,
-                "message": "زمان‌بندی با موفقیت ثبت شد.",
-                "posts": self._serialize_posts(posts),
-            }
-            if post_error:
-                payload["warning"] = post_error
-            return JSONResponse(payload, status_code=201)
+            return self._posts_payload(
+                db, success=True, status_code=201, message="زمان‌بندی با موفقیت ثبت شد."
+            )
         return RedirectResponse(url="/scheduler", status_code=302)
 
     def delete_schedule(
@@ -225,30 +301,12 @@ class SchedulerPresenter:
                 extra={"user_id": user.id, "post_id": post_id},
                 exc_info=exc,
             )
-            accounts, account_error = self._load_accounts(db)
-            posts, post_error = self._load_posts(db)
-            context = {
-                "request": request,
-                "user": user,
-                "accounts": accounts,
-                "posts": posts,
-                "error": "حذف پست زمان‌بندی شده با خطا مواجه شد.",
-                "active_page": "scheduler",
-            }
-            extra_errors = [msg for msg in (account_error, post_error) if msg]
-            if extra_errors:
-                context.setdefault("load_error", " ".join(dict.fromkeys(extra_errors)))
-            if self._is_ajax(request):
-                payload = {
-                    "success": False,
-                    "error": "حذف پست زمان‌بندی شده با خطا مواجه شد.",
-                    "posts": self._serialize_posts(posts),
-                }
-                if extra_errors:
-                    payload["warning"] = " ".join(dict.fromkeys(extra_errors))
-                return JSONResponse(payload, status_code=500)
-            return self.templates.TemplateResponse(
-                request, "scheduler.html", context, status_code=500
+            return self._schedule_error_response(
+                request,
+                db,
+                user,
+                "حذف پست زمان‌بندی شده با خطا مواجه شد.",
+                status_code=500,
             )
 
         if deleted:
@@ -261,14 +319,8 @@ class SchedulerPresenter:
                 "Attempted to delete non-existent scheduled post",
                 extra={"user_id": user.id, "post_id": post_id},
             )
-        posts, post_error = self._load_posts(db)
         if self._is_ajax(request):
-            payload: dict[str, object] = {
-                "success": True,
-                "message": "پست زمان‌بندی شده حذف شد.",
-                "posts": self._serialize_posts(posts),
-            }
-            if post_error:
-                payload["warning"] = post_error
-            return JSONResponse(payload, status_code=200)
+            return self._posts_payload(
+                db, success=True, status_code=200, message="پست زمان‌بندی شده حذف شد."
+            )
         return RedirectResponse(url="/scheduler", status_code=302)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Mapping
 
 from fastapi import Request
@@ -15,7 +15,7 @@ from app.backend import models
 from app.backend.services import permissions as permissions_service
 from app.backend.services.data_access import DatabaseServiceError, ServiceTokenService
 
-from .helpers import is_ajax_request, json_error, json_success
+from .helpers import PageTemplate, is_ajax_request, json_error, json_success
 
 @dataclass(slots=True)
 class SettingsPresenter:
@@ -23,9 +23,14 @@ class SettingsPresenter:
 
     templates: Jinja2Templates
     logger: logging.Logger = logging.getLogger("app.ui.settings")
+    _page: PageTemplate = field(init=False, repr=False)
 
-    def _load_tokens(self, db: Session) -> tuple[list[models.ServiceToken], str | None]:
-        service = ServiceTokenService(db)
+    def __post_init__(self) -> None:
+        self._page = PageTemplate(self.templates, "settings.html")
+
+    def _load_tokens(
+        self, service: ServiceTokenService
+    ) -> tuple[list[models.ServiceToken], str | None]:
         try:
             tokens = list(service.list_tokens())
             return tokens, None
@@ -33,17 +38,50 @@ class SettingsPresenter:
             self.logger.error("Failed to load service tokens", exc_info=exc)
             return [], "بارگذاری توکن‌ها با خطا مواجه شد."
 
-    def render(self, request: Request, user: models.AdminUser, db: Session) -> object:
-        tokens, load_error = self._load_tokens(db)
-        context = {
+    @staticmethod
+    def _build_context(
+        request: Request, user: models.AdminUser, tokens: list[models.ServiceToken]
+    ) -> dict[str, object]:
+        return {
             "request": request,
             "user": user,
             "tokens": tokens,
             "active_page": "settings",
         }
+
+    def _token_error_response(
+        self,
+        request: Request,
+        service: ServiceTokenService,
+        user: models.AdminUser,
+        error_message: str,
+        *,
+        status_code: int,
+    ) -> object:
+        """Respond to a failed token mutation with the refreshed token list.
+
+        ``service`` is the one the failed mutation used, so a request builds a
+        single ``ServiceTokenService`` even on its error path.
+        """
+
+        tokens, load_error = self._load_tokens(service)
+        if is_ajax_request(request):
+            payload: dict[str, object] = {}
+            if load_error:
+                payload["warning"] = load_error
+            return json_error(error_message, status_code=status_code, **payload)
+        context = self._build_context(request, user, tokens)
+        context["error"] = error_message
+        if load_error:
+            context["load_error"] = load_error
+        return self._page.render(context, status_code=status_code)
+
+    def render(self, request: Request, user: models.AdminUser, db: Session) -> object:
+        tokens, load_error = self._load_tokens(ServiceTokenService(db))
+        context = self._build_context(request, user, tokens)
         if load_error:
             context["error"] = load_error
-        return self.templates.TemplateResponse(request, "settings.html", context)
+        return self._page.render(context)
 
     def save_token(
         self,
@@ -70,24 +108,8 @@ class SettingsPresenter:
                 extra={"user_id": user.id, "key": key},
                 exc_info=exc,
             )
-            tokens, load_error = self._load_tokens(db)
-            error_message = "ذخیره توکن با خطا مواجه شد."
-            if is_ajax_request(request):
-                payload: dict[str, object] = {}
-                if load_error:
-                    payload["warning"] = load_error
-                return json_error(error_message, status_code=500, **payload)
-            context = {
-                "request": request,
-                "user": user,
-                "tokens": tokens,
-                "error": error_message,
-                "active_page": "settings",
-            }
-            if load_error:
-                context.setdefault("load_error", load_error)
-            return self.templates.TemplateResponse(
-                request, "settings.html", context, status_code=500
+            return self._token_error_response(
+                request, service, user, "ذخیره توکن با خطا مواجه شد.", status_code=500
             )
 
         action = "created" if created else "updated"
@@ -118,24 +140,8 @@ class SettingsPresenter:
                 extra={"user_id": user.id, "token_id": token_id},
                 exc_info=exc,
             )
-            tokens, load_error = self._load_tokens(db)
-            error_message = "حذف توکن با خطا مواجه شد."
-            if is_ajax_request(request):
-                payload: dict[str, object] = {}
-                if load_error:
-                    payload["warning"] = load_error
-                return json_error(error_message, status_code=500, **payload)
-            context = {
-                "request": request,
-                "user": user,
-                "tokens": tokens,
-                "error": error_message,
-                "active_page": "settings",
-            }
-            if load_error:
-                context.setdefault("load_error", load_error)
-            return self.templates.TemplateResponse(
-                request, "settings.html", context, status_code=500
+            return self._token_error_response(
+                request, service, user, "حذف توکن با خطا مواجه شد.", status_code=500
             )
 
         if deleted:
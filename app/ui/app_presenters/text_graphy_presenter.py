@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import logging
 import re
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Sequence
 
@@ -22,6 +22,8 @@ from app.backend.services.text_graphy import (
     TextGraphyServiceError,
 )
 
+from .helpers import PageTemplate
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -57,6 +59,9 @@ class TextGraphyFormState:
     error: Optional[str] = None
     plan: Optional[TextGraphyPlan] = None
     downloads: Optional[TextGraphyDownloads] = None
+    # Serialised once per plan and shared by the artifact files and the page.
+    webvtt: Optional[str] = None
+    lines_json: Optional[str] = None
     stages: Optional[tuple[TextGraphyProcessingStage, ...]] = None
     token_label: Optional[str] = None
     token_hint: Optional[str] = None
@@ -72,11 +77,31 @@ DEFAULT_LYRICS = (
 DEFAULT_COVERR_REFERENCE = "sunset-over-the-lake"
 DEFAULT_MUSIC_URL = "https://cdn.coverr.co/audio/coverr-ambient-rising.mp3"
 DEFAULT_MUSIC_DURATION = "02:00"
+_ACTIVE_TOKENS_HINT = "توکن‌های فعال از بخش تنظیمات بارگذاری شده‌اند."
+_INVALID_DURATION_ERROR = "فرمت مدت زمان موزیک معتبر نیست. از قالب mm:ss یا ثانیه استفاده کنید."
+_PLAN_READY_INFO = "پیش‌نمایش تکس گرافی با موفقیت ساخته شد."
+_UNEXPECTED_ERROR = "خطای غیرمنتظره هنگام ساخت تکس گرافی رخ داد."
+
+# Shared by every blank GET render; ``render`` never mutates its state.
+_DEFAULT_FORM_STATE = TextGraphyFormState(
+    coverr_reference=DEFAULT_COVERR_REFERENCE,
+    music_url=DEFAULT_MUSIC_URL,
+    music_duration=DEFAULT_MUSIC_DURATION,
+    lyrics_text=DEFAULT_LYRICS,
+)
+
+# ``[[hh:]mm:]ss`` where seconds may carry a ``.`` or ``,`` decimal part;
+# like ``float()``, either side of the separator may be empty (``.5``, ``5.``).
+_DURATION_RE = re.compile(r"(?:(?:(\d+):)?(\d+):)?(\d+(?:[.,]\d*)?|[.,]\d+)")
+# ``str`` patterns match Unicode word characters by default.
+_IDENTIFIER_UNSAFE_RE = re.compile(r"[^\w-]+")
 
 
 class TextGraphyPresenter:
     """Prepare the template data for the Text Graphy page."""
 
+    logger: logging.Logger = logging.getLogger("app.ui.text_graphy")
+
     def __init__(
         self,
         templates: Jinja2Templates,
@@ -84,7 +109,7 @@ class TextGraphyPresenter:
     ) -> None:
         self.templates = templates
         self.service = service
-        self.logger = logging.getLogger("app.ui.text_graphy")
+        self._page = PageTemplate(templates, "text_graphy.html")
         self.download_storage_dir = Path("app/ui/static/text_graphy")
         self.download_url_prefix = "/static/text_graphy"
 
@@ -95,13 +120,21 @@ class TextGraphyPresenter:
         form_state: Optional[TextGraphyFormState] = None,
         token_usage: Optional[Sequence[TextGraphyTokenUsage]] = None,
     ):
+        # ``state`` may be the shared default, so token overrides stay local.
         state = form_state or self._default_state()
+        usage = state.token_usage
+        token_hint = state.token_hint
         if token_usage is not None:
-            state.token_usage = tuple(token_usage)
-            if state.token_hint is None and token_usage:
-                state.token_hint = "توکن‌های فعال از بخش تنظیمات بارگذاری شده‌اند."
+            usage = tuple(token_usage)
+            if token_hint is None and token_usage:
+                token_hint = _ACTIVE_TOKENS_HINT
         result_payload = (
-            self._plan_to_payload(state.plan, state.downloads)
+            self._plan_to_payload(
+                state.plan,
+                state.downloads,
+                webvtt=state.webvtt,
+                lines_json=state.lines_json,
+            )
             if state.plan
             else None
         )
@@ -115,10 +148,10 @@ class TextGraphyPresenter:
             "error": state.error,
             "stages": state.stages,
             "token_label": state.token_label,
-            "token_hint": state.token_hint,
-            "token_usage": state.token_usage,
+            "token_hint": token_hint,
+            "token_usage": usage,
         }
-        return self.templates.TemplateResponse(request, "text_graphy.html", context)
+        return self._page.render(context)
 
     def create_text_graphy(
         self,
@@ -130,18 +163,21 @@ class TextGraphyPresenter:
         music_duration: Optional[str],
         lyrics_text: str,
         token_usage: Optional[Sequence[TextGraphyTokenUsage]] = None,
+        persist: bool = True,
     ):
         duration_seconds: Optional[float] = None
         error: Optional[str] = None
         info: Optional[str] = None
         plan: Optional[TextGraphyPlan] = None
         downloads: Optional[TextGraphyDownloads] = None
+        webvtt: Optional[str] = None
+        lines_json: Optional[str] = None
         diagnostics: Optional[TextGraphyDiagnostics] = None
 
         try:
             duration_seconds = self._parse_duration(music_duration)
         except ValueError as exc:
-            error = "فرمت مدت زمان موزیک معتبر نیست. از قالب mm:ss یا ثانیه استفاده کنید."
+            error = _INVALID_DURATION_ERROR
             self._log_text_graphy_error(
                 "Invalid audio duration provided for Text Graphy submission",
                 error=exc,
@@ -157,17 +193,24 @@ class TextGraphyPresenter:
                     audio_url=music_url if music_url else None,
                     audio_duration=duration_seconds,
                 )
-                info = "پیش‌نمایش تکس گرافی با موفقیت ساخته شد."
-                try:
-                    downloads = self._persist_plan_artifacts(plan)
-                except Exception as exc:  # pragma: no cover - defensive for IO errors
-                    self._log_text_graphy_error(
-                        "Failed to persist Text Graphy artifacts",
-                        error=exc,
-                        coverr_reference=coverr_reference,
-                        diagnostics=diagnostics,
-                        level=logging.ERROR,
-                    )
+                info = _PLAN_READY_INFO
+                webvtt = plan.as_webvtt()
+                lines_json = plan.lines_json()
+                # Without stored files the page offers the inline WebVTT and
+                # JSON as client-side downloads, so callers may skip the I/O.
+                if persist:
+                    try:
+                        downloads = self._persist_plan_artifacts(
+                            plan, webvtt=webvtt, lines_json=lines_json
+                        )
+                    except Exception as exc:  # pragma: no cover - defensive for IO errors
+                        self._log_text_graphy_error(
+                            "Failed to persist Text Graphy artifacts",
+                            error=exc,
+                            coverr_reference=coverr_reference,
+                            diagnostics=diagnostics,
+                            level=logging.ERROR,
+                        )
             except CoverrAPIError as exc:
                 diagnostics = getattr(exc, "diagnostics", diagnostics)
                 cause = exc.__cause__ or exc.__context__
@@ -216,12 +259,15 @@ class TextGraphyPresenter:
                     "Unexpected error while building Text Graphy plan",
                     extra={"stage": "logs"},
                 )
-                error = "خطای غیرمنتظره هنگام ساخت تکس گرافی رخ داد."
+                error = _UNEXPECTED_ERROR
 
         token_label = diagnostics.token_label if diagnostics else None
         token_hint = diagnostics.token_hint if diagnostics else None
         if token_hint is None and token_usage:
-            token_hint = "توکن‌های فعال از بخش تنظیمات بارگذاری شده‌اند."
+            token_hint = _ACTIVE_TOKENS_HINT
+        # Convert once; ``render`` calls ``tuple()`` again, which returns a
+        # tuple argument unchanged instead of copying it.
+        usage = tuple(token_usage) if token_usage is not None else None
 
         state = TextGraphyFormState(
             coverr_reference=coverr_reference,
@@ -232,30 +278,32 @@ class TextGraphyPresenter:
             error=error,
             plan=plan,
             downloads=downloads,
+            webvtt=webvtt,
+            lines_json=lines_json,
             stages=diagnostics.stages if diagnostics else None,
             token_label=token_label,
             token_hint=token_hint,
-            token_usage=tuple(token_usage) if token_usage else None,
+            token_usage=usage or None,
         )
-        return self.render(request, user, state, token_usage=token_usage)
+        return self.render(request, user, state, token_usage=usage)
 
     def _default_state(self) -> TextGraphyFormState:
-        return TextGraphyFormState(
-            coverr_reference=DEFAULT_COVERR_REFERENCE,
-            music_url=DEFAULT_MUSIC_URL,
-            music_duration=DEFAULT_MUSIC_DURATION,
-            lyrics_text=DEFAULT_LYRICS,
-        )
+        return _DEFAULT_FORM_STATE
 
     def _plan_to_payload(
-        self, plan: TextGraphyPlan, downloads: Optional[TextGraphyDownloads]
+        self,
+        plan: TextGraphyPlan,
+        downloads: Optional[TextGraphyDownloads],
+        *,
+        webvtt: Optional[str] = None,
+        lines_json: Optional[str] = None,
     ):
         payload = {
             "video": plan.video,
             "audio_url": plan.audio_url,
             "lines": plan.lines,
-            "lines_json": plan.lines_json(),
-            "webvtt": plan.as_webvtt(),
+            "lines_json": lines_json if lines_json is not None else plan.lines_json(),
+            "webvtt": webvtt if webvtt is not None else plan.as_webvtt(),
             "total_duration": plan.total_duration,
         }
         if downloads:
@@ -267,25 +315,45 @@ class TextGraphyPresenter:
             }
         return payload
 
-    def _persist_plan_artifacts(self, plan: TextGraphyPlan) -> TextGraphyDownloads:
+    def _persist_plan_artifacts(
+        self,
+        plan: TextGraphyPlan,
+        *,
+        webvtt: Optional[str] = None,
+        lines_json: Optional[str] = None,
+    ) -> TextGraphyDownloads:
         base_name = self._sanitize_identifier(plan.video.identifier)
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        # ``gmtime`` plus fixed-width formatting yields the same UTC stamp as
+        # ``datetime.now(timezone.utc).strftime`` without building a datetime.
+        now = time.gmtime()
+        timestamp = "%04d%02d%02d%02d%02d%02d" % now[:6]
         directory = self.download_storage_dir
         directory.mkdir(parents=True, exist_ok=True)
 
-        def _unique_path(suffix: str) -> Path:
+        def _write_unique(suffix: str, content: str) -> Path:
+            # Exclusive-create mode claims a free name in the same syscall that
+            # opens the file, so there is no separate ``exists`` probe and no
+            # window for a concurrent submission to take the name in between.
+            # The content is encoded up front and written in binary mode,
+            # skipping the ``TextIOWrapper`` layer.
+            data = content.encode("utf-8")
             candidate = directory / f"{base_name}-{timestamp}{suffix}"
             counter = 1
-            while candidate.exists():
-                candidate = directory / f"{base_name}-{timestamp}-{counter}{suffix}"
-                counter += 1
-            return candidate
-
-        webvtt_path = _unique_path(".vtt")
-        lines_json_path = _unique_path(".json")
-
-        webvtt_path.write_text(plan.as_webvtt(), encoding="utf-8")
-        lines_json_path.write_text(plan.lines_json(), encoding="utf-8")
+            while True:
+                try:
+                    with candidate.open("xb") as handle:
+                        handle.write(data)
+                    return candidate
+                except FileExistsError:
+                    candidate = directory / f"{base_name}-{timestamp}-{counter}{suffix}"
+                    counter += 1
+
+        webvtt_path = _write_unique(
+            ".vtt", webvtt if webvtt is not None else plan.as_webvtt()
+        )
+        lines_json_path = _write_unique(
+            ".json", lines_json if lines_json is not None else plan.lines_json()
+        )
 
         return TextGraphyDownloads(
             webvtt_path=webvtt_path,
@@ -298,7 +366,7 @@ class TextGraphyPresenter:
     def _sanitize_identifier(identifier: Optional[str]) -> str:
         clean = (identifier or "text-graphy").strip()
         clean = clean or "text-graphy"
-        clean = re.sub(r"[^\w-]+", "-", clean, flags=re.UNICODE)
+        clean = _IDENTIFIER_UNSAFE_RE.sub("-", clean)
         clean = clean.strip("-") or "text-graphy"
         return clean.lower()
 
@@ -329,15 +397,13 @@ class TextGraphyPresenter:
                 }
                 for stage in diagnostics.stages
             ]
-        context_segments: list[str] = []
         location = extra_payload.get("error_origin")
-        if location:
-            context_segments.append(f"error_origin={location}")
-        coverr_ref = extra_payload.get("coverr_reference")
-        if coverr_ref:
-            context_segments.append(f"coverr_reference={coverr_ref}")
-        if context_segments:
-            message = f"{message} [{' '.join(context_segments)}]"
+        if location and coverr_reference:
+            message = f"{message} [error_origin={location} coverr_reference={coverr_reference}]"
+        elif location:
+            message = f"{message} [error_origin={location}]"
+        elif coverr_reference:
+            message = f"{message} [coverr_reference={coverr_reference}]"
         self.logger.log(level, message, extra=extra_payload)
 
     @staticmethod
@@ -373,15 +439,21 @@ class TextGraphyPresenter:
         if not value:
             return None
 
-        normalized = value.replace(",", ".")
-        if ":" in normalized:
-            parts = normalized.split(":")
-            if len(parts) == 2:
-                minutes, seconds = parts
-                return float(minutes) * 60 + float(seconds)
-            if len(parts) == 3:
-                hours, minutes, seconds = parts
-                return float(hours) * 3600 + float(minutes) * 60 + float(seconds)
-            raise ValueError("invalid duration format")
+        # Fast paths for the usual ``ss`` and ``mm:ss`` inputs. ``isdecimal``
+        # accepts exactly what the pattern's ``\d`` does.
+        if value.isdecimal():
+            return float(int(value))
+        minutes, sep, seconds = value.partition(":")
+        if sep and minutes.isdecimal() and seconds.isdecimal():
+            return float(int(minutes) * 60 + int(seconds))
 
-        return float(normalized)
+        match = _DURATION_RE.fullmatch(value)
+        if match is None:
+            raise ValueError("invalid duration format")
+        hours, minutes, seconds = match.groups()
+        total = float(seconds.replace(",", "."))
+        if minutes:
+            total += int(minutes) * 60
+        if hours:
+            total += int(hours) * 3600
+        return total
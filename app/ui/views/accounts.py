@@ -6,13 +6,13 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 
-from app.backend import auth, models
+from app.backend import models
 from app.backend.database import get_db
 
 from ..app_presenters.accounts_presenter import AccountsPresenter
+from .dependencies import login_required
 
 
 logger = logging.getLogger(__name__)
@@ -20,43 +20,33 @@ logger = logging.getLogger(__name__)
 
 def create_router(presenter: AccountsPresenter) -> APIRouter:
     router = APIRouter()
+    accounts_user = login_required(required_menu=models.AdminMenu.ACCOUNTS)
 
     @router.get("/accounts")
-    async def list_accounts(request: Request, db: Session = Depends(get_db)):
-        user = auth.get_logged_in_user(
-            request,
-            db,
-            required_menu=models.AdminMenu.ACCOUNTS,
-        )
-        if not user:
-            logger.info("Unauthenticated accounts list access redirected")
-            return RedirectResponse(url="/login", status_code=302)
+    async def list_accounts(
+        request: Request,
+        user: models.AdminUser = Depends(accounts_user),
+        db: Session = Depends(get_db),
+    ):
         logger.info("Rendering accounts list", extra={"user_id": user.id})
         return presenter.list_accounts(request, user, db)
 
     @router.get("/accounts/new")
-    async def new_account(request: Request, db: Session = Depends(get_db)):
-        user = auth.get_logged_in_user(
-            request,
-            db,
-            required_menu=models.AdminMenu.ACCOUNTS,
-        )
-        if not user:
-            logger.info("Unauthenticated new account access redirected")
-            return RedirectResponse(url="/login", status_code=302)
+    async def new_account(
+        request: Request,
+        user: models.AdminUser = Depends(accounts_user),
+        db: Session = Depends(get_db),
+    ):
         logger.info("Rendering new account form", extra={"user_id": user.id})
         return presenter.account_form(request, user, db=db)
 
     @router.get("/accounts/{account_id}")
-    async def edit_account(account_id: int, request: Request, db: Session = Depends(get_db)):
-        user = auth.get_logged_in_user(
-            request,
-            db,
-            required_menu=models.AdminMenu.ACCOUNTS,
-        )
-        if not user:
-            logger.info("Unauthenticated account edit redirected", extra={"account_id": account_id})
-            return RedirectResponse(url="/login", status_code=302)
+    async def edit_account(
+        account_id: int,
+        request: Request,
+        user: models.AdminUser = Depends(accounts_user),
+        db: Session = Depends(get_db),
+    ):
         logger.info(
             "Rendering account edit form",
             extra={"user_id": user.id, "account_id": account_id},
@@ -73,16 +63,9 @@ def create_router(presenter: AccountsPresenter) -> APIRouter:
         youtube_channel_id: Optional[str] = Form(None),
         telegram_chat_id: Optional[str] = Form(None),
         account_id: Optional[int] = Form(None),
+        user: models.AdminUser = Depends(accounts_user),
         db: Session = Depends(get_db),
     ):
-        user = auth.get_logged_in_user(
-            request,
-            db,
-            required_menu=models.AdminMenu.ACCOUNTS,
-        )
-        if not user:
-            logger.info("Unauthenticated account save redirected")
-            return RedirectResponse(url="/login", status_code=302)
         logger.info(
             "Saving account",
             extra={
@@ -109,19 +92,9 @@ def create_router(presenter: AccountsPresenter) -> APIRouter:
     async def delete_account(
         request: Request,
         account_id: int = Form(...),
+        user: models.AdminUser = Depends(accounts_user),
         db: Session = Depends(get_db),
     ):
-        user = auth.get_logged_in_user(
-            request,
-            db,
-            required_menu=models.AdminMenu.ACCOUNTS,
-        )
-        if not user:
-            logger.info(
-                "Unauthenticated account delete redirected",
-                extra={"account_id": account_id},
-            )
-            return RedirectResponse(url="/login", status_code=302)
         return presenter.delete_account(
             request=request,
             db=db,
@@ -0,0 +1,48 @@
+"""Shared FastAPI dependencies for the UI routes."""
+
+from __future__ import annotations
+
+import logging
+from typing import Awaitable, Callable, Iterable, Optional
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy.orm import Session
+
+from app.backend import auth, models
+from app.backend.database import get_db
+
+
+logger = logging.getLogger(__name__)
+
+
+def login_required(
+    *,
+    required_menu: Optional[models.AdminMenu] = None,
+    required_roles: Optional[Iterable[models.AdminRole]] = None,
+) -> Callable[..., Awaitable[models.AdminUser]]:
+    """Build a dependency that resolves the logged-in user.
+
+    Anonymous requests are answered with a ``302`` to ``/login`` raised as an
+    ``HTTPException``, so routers need no app-level exception handler. The
+    route's own ``Depends(get_db)`` shares the cached per-request session.
+    """
+
+    async def dependency(request: Request, db: Session = Depends(get_db)) -> models.AdminUser:
+        user = auth.get_logged_in_user(
+            request,
+            db,
+            required_roles=required_roles,
+            required_menu=required_menu,
+        )
+        if not user:
+            logger.info(
+                "Unauthenticated request redirected to login",
+                extra={"path": request.url.path},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_302_FOUND,
+                headers={"Location": "/login"},
+            )
+        return user
+
+    return dependency
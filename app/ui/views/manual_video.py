@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Form, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, Request
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 
@@ -37,6 +37,7 @@ def create_router(presenter: ManualVideoPresenter) -> APIRouter:
     @router.post("/manual-video")
     async def create_manual_video(
         request: Request,
+        background_tasks: BackgroundTasks,
         title: str = Form(...),
         description: Optional[str] = Form(None),
         media_url: str = Form(...),
@@ -67,6 +68,7 @@ def create_router(presenter: ManualVideoPresenter) -> APIRouter:
             request=request,
             db=db,
             user=user,
+            background_tasks=background_tasks,
             title=title,
             description=description,
             media_url=media_url,
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 
 from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 
@@ -31,6 +32,8 @@ def create_router(presenter: MediaLibraryPresenter) -> APIRouter:
             logger.info("Media library access redirected for unauthenticated user")
             return RedirectResponse(url="/login", status_code=302)
         logger.info("Rendering media library", extra={"user_id": user.id})
-        return presenter.render(request, user, db)
+        # Listing, category counts and template rendering are blocking; keep
+        # them off the event loop.
+        return await run_in_threadpool(presenter.render, request, user, db)
 
     return router
@@ -6,6 +6,7 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 
@@ -32,7 +33,9 @@ def create_router(presenter: SchedulerPresenter) -> APIRouter:
             logger.info("Scheduler access redirected for unauthenticated user")
             return RedirectResponse(url="/login", status_code=302)
         logger.info("Rendering scheduler page", extra={"user_id": user.id})
-        return presenter.render(request, user, db)
+        # The presenter queries the database and renders synchronously; keep
+        # that work off the event loop.
+        return await run_in_threadpool(presenter.render, request, user, db)
 
     @router.post("/scheduler")
     async def create_schedule(
@@ -61,7 +64,8 @@ def create_router(presenter: SchedulerPresenter) -> APIRouter:
                 "has_video_url": bool(video_url),
             },
         )
-        return presenter.create_schedule(
+        return await run_in_threadpool(
+            presenter.create_schedule,
             request=request,
             db=db,
             user=user,
@@ -86,7 +90,8 @@ def create_router(presenter: SchedulerPresenter) -> APIRouter:
         if not user:
             logger.info("Schedule delete redirected for unauthenticated user", extra={"post_id": post_id})
             return RedirectResponse(url="/login", status_code=302)
-        return presenter.delete_schedule(
+        return await run_in_threadpool(
+            presenter.delete_schedule,
             request=request,
             db=db,
             user=user,
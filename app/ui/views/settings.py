@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 
 from fastapi import APIRouter, Depends, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 
@@ -34,7 +35,9 @@ def create_router(presenter: SettingsPresenter) -> APIRouter:
             logger.info("Settings access denied for unauthenticated user")
             return RedirectResponse(url="/login", status_code=302)
         logger.info("Rendering settings page", extra={"user_id": user.id})
-        return presenter.render(request, user, db)
+        # Token queries, decryption and rendering are blocking; keep them off
+        # the event loop.
+        return await run_in_threadpool(presenter.render, request, user, db)
 
     @router.post("/settings")
     async def create_or_update_token(
@@ -54,7 +57,8 @@ def create_router(presenter: SettingsPresenter) -> APIRouter:
         if not user:
             logger.info("Token save denied for unauthenticated user")
             return RedirectResponse(url="/login", status_code=302)
-        return presenter.save_token(
+        return await run_in_threadpool(
+            presenter.save_token,
             request=request,
             db=db,
             user=user,
@@ -79,7 +83,8 @@ def create_router(presenter: SettingsPresenter) -> APIRouter:
         if not user:
             logger.info("Token delete denied for unauthenticated user", extra={"token_id": token_id})
             return RedirectResponse(url="/login", status_code=302)
-        return presenter.delete_token(
+        return await run_in_threadpool(
+            presenter.delete_token,
             request=request,
             db=db,
             user=user,
@@ -97,7 +102,8 @@ def create_router(presenter: SettingsPresenter) -> APIRouter:
         if not user:
             return RedirectResponse(url="/login", status_code=302)
         form_data = await request.form()
-        return presenter.update_permissions(
+        return await run_in_threadpool(
+            presenter.update_permissions,
             request=request,
             db=db,
             user=user,
@@ -6,6 +6,7 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 
@@ -63,8 +64,10 @@ def create_router(presenter: TextGraphyPresenter) -> APIRouter:
             logger.info("Text Graphy page redirected for unauthenticated user")
             return RedirectResponse(url="/login", status_code=302)
         logger.info("Rendering Text Graphy page", extra={"user_id": user.id})
-        token_usage = _load_text_graphy_tokens(db)
-        return presenter.render(request, user, token_usage=token_usage)
+        token_usage = await run_in_threadpool(_load_text_graphy_tokens, db)
+        return await run_in_threadpool(
+            presenter.render, request, user, token_usage=token_usage
+        )
 
     @router.post("/text-graphy")
     async def create_text_graphy(
@@ -73,6 +76,7 @@ def create_router(presenter: TextGraphyPresenter) -> APIRouter:
         lyrics_text: str = Form(...),
         music_url: Optional[str] = Form(None),
         music_duration: Optional[str] = Form(None),
+        persist: bool = Form(True),
         db: Session = Depends(get_db),
     ):
         user = auth.get_logged_in_user(
@@ -91,14 +95,23 @@ def create_router(presenter: TextGraphyPresenter) -> APIRouter:
                 "has_duration": bool(music_duration),
             },
         )
-        return presenter.create_text_graphy(
+        token_usage = await run_in_threadpool(_load_text_graphy_tokens, db)
+        # HTMX fragment swaps only consume the inline preview, so they never
+        # need the artifact files written to disk.
+        if request.headers.get("hx-request") == "true":
+            persist = False
+        # Building a plan calls the Coverr API and the translator over blocking
+        # HTTP, so it must not run on the event loop.
+        return await run_in_threadpool(
+            presenter.create_text_graphy,
             request=request,
             user=user,
             coverr_reference=coverr_reference,
             music_url=music_url,
             music_duration=music_duration,
             lyrics_text=lyrics_text,
-            token_usage=_load_text_graphy_tokens(db),
+            token_usage=token_usage,
+            persist=persist,
         )
 
     return router
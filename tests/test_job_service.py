@@ -1,13 +1,15 @@
 import pathlib
 import sys
+from datetime import datetime
 
 import pytest
+from sqlalchemy import event
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 
 from app.backend.database import Base, SessionLocal, engine
 from app.backend.models import Campaign, Job, JobMedia
-from app.backend.services import JobService
+from app.backend.services import JobQueryService, JobService
 
 
 @pytest.fixture(autouse=True)
@@ -203,3 +205,95 @@ def test_campaign_name_is_trimmed_before_persist():
         job_row = session.get(Job, job.id)
         assert job_row is not None
         assert job_row.ai_tool == "HeyGen"
+
+
+def test_list_recent_jobs_eager_loads_relationships_in_constant_queries():
+    service = JobService()
+    for index in range(10):
+        service.create_job_with_media_and_campaign(
+            {"title": f"Clip {index}", "description": "", "ai_tool": "Runway"},
+            [{"media_type": "video/mp4", "media_url": f"https://cdn.example.com/{index}.mp4"}],
+            {"name": f"Campaign {index}"},
+        )
+
+    statements: list[str] = []
+
+    def _count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    with SessionLocal() as session:
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            jobs = JobQueryService(session).list_recent_jobs(
+                limit=10, eager=("campaign", "media")
+            )
+            rows = [(job.campaign.name, job.media[0].media_url) for job in jobs]
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+
+    assert len(rows) == 10
+    assert len(statements) < 5
+
+
+def test_list_recent_media_loads_job_and_campaign_in_constant_queries():
+    service = JobService()
+    for index in range(12):
+        service.create_job_with_media_and_campaign(
+            {"title": f"Asset {index}", "description": "", "ai_tool": "Runway"},
+            [{"media_type": "video/mp4", "media_url": f"https://cdn.example.com/a{index}.mp4"}],
+            {"name": f"Campaign {index}"},
+        )
+
+    statements: list[str] = []
+
+    def _count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    with SessionLocal() as session:
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            media = JobQueryService(session).list_recent_media(limit=60)
+            names = [item.job.campaign.name for item in media]
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+
+    assert len(names) == 12
+    assert len(statements) < 5
+
+
+def test_list_recent_media_rows_formats_display_columns_in_sql():
+    with SessionLocal() as session:
+        job = Job(title="Promo", description="", ai_tool="Runway")
+        session.add(job)
+        session.flush()
+        session.add_all(
+            [
+                JobMedia(
+                    job_id=job.id,
+                    media_type="video/mp4",
+                    storage_url="/static/uploads/a.mp4",
+                    created_at=datetime(2024, 5, 1, 9, 7, 33),
+                ),
+                JobMedia(
+                    job_id=job.id,
+                    media_type="video/mp4",
+                    media_url="https://cdn.example.com/b.mp4",
+                    created_at=datetime(2024, 5, 2, 18, 30),
+                ),
+                JobMedia(
+                    job_id=job.id,
+                    media_type="image/png",
+                    storage_url="   ",
+                    created_at=datetime(2024, 5, 3, 0, 0),
+                ),
+            ]
+        )
+        session.commit()
+
+        rows = JobQueryService(session).list_recent_media_rows(limit=10)
+
+    assert [(row.created_display, row.source_kind) for row in rows] == [
+        ("2024-05-03 00:00", "none"),
+        ("2024-05-02 18:30", "external"),
+        ("2024-05-01 09:07", "storage"),
+    ]
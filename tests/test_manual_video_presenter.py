@@ -10,6 +10,7 @@ import pytest
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 
+from fastapi import BackgroundTasks
 from fastapi.responses import RedirectResponse
 
 from app.ui.app_presenters import manual_video_presenter
@@ -96,47 +97,109 @@ def test_download_manual_video_preview_persists_file(monkeypatch, tmp_path):
         def raise_for_status(self):
             return None
 
-        async def aread(self):  # pragma: no cover - simple async reader
-            return b"chunk-data"
+        async def aiter_raw(self, chunk_size=None):  # pragma: no cover - simple async reader
+            calls.append(("chunk_size", chunk_size))
+            yield b"chunk-"
+            yield b"data"
 
-        async def aclose(self):
+    class DummyStream:
+        async def __aenter__(self):
+            return DummyResponse()
+
+        async def __aexit__(self, exc_type, exc, tb):
             calls.append("closed")
+            return False
 
     class DummyAsyncClient:
-        def __init__(self, timeout=15):
+        def __init__(self, timeout=15, transport=None):
             self.timeout = timeout
+            self.transport = transport
 
-        async def __aenter__(self):
-            return self
+        async def aclose(self):
+            calls.append("client-closed")
 
-        async def __aexit__(self, exc_type, exc, tb):  # pragma: no cover - no-op
-            return False
-
-        async def get(self, url):
-            calls.append((url, self.timeout))
-            return DummyResponse()
+        def stream(self, method, url, headers=None):
+            calls.append((method, url, self.timeout, headers))
+            return DummyStream()
 
     class DummyHttpx:
         def __init__(self):
             self.calls = calls
 
-        def AsyncClient(self, timeout=15):  # pragma: no cover - factory pattern
-            return DummyAsyncClient(timeout)
+        def AsyncClient(self, timeout=15, transport=None):  # pragma: no cover - factory pattern
+            return DummyAsyncClient(timeout, transport)
+
+        def AsyncHTTPTransport(self, **kwargs):
+            return kwargs
+
+        def Limits(self, **kwargs):
+            return kwargs
 
     monkeypatch.setattr(manual_video_presenter, "httpx", DummyHttpx())
 
     presenter = _create_presenter(tmp_path)
     url = "https://cdn.example/assets/video.mp4"
 
-    local_path = asyncio.run(presenter._download_manual_video_preview(url, job_id=7))
+    async def _download_twice():
+        first = await presenter._download_manual_video_preview(url, job_id=7)
+        client = presenter._download_client
+        await presenter._download_manual_video_preview(url, job_id=8)
+        assert presenter._download_client is client
+        await presenter.aclose()
+        return first
+
+    local_path = asyncio.run(_download_twice())
 
-    assert (url, 15) in calls
+    assert ("GET", url, 15, {"Accept-Encoding": "identity"}) in calls
+    assert ("chunk_size", manual_video_presenter.PREVIEW_CHUNK_SIZE) in calls
     assert "closed" in calls
+    assert calls.count("client-closed") == 1
     assert local_path is not None
     assert local_path.name == "job-7.mp4"
     assert local_path.read_bytes() == b"chunk-data"
 
 
+def test_download_manual_video_preview_removes_partial_file_on_write_error(monkeypatch, tmp_path):
+    class DummyResponse:
+        status_code = 200
+
+        def raise_for_status(self):
+            return None
+
+    class DummyStream:
+        async def __aenter__(self):
+            return DummyResponse()
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+    async def _failing_stream(response, target_path):
+        target_path.write_bytes(b"truncated")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manual_video_presenter, "httpx", SimpleNamespace())
+    monkeypatch.setattr(ManualVideoPresenter, "_stream_preview_to_disk", staticmethod(_failing_stream))
+    presenter = _create_presenter(tmp_path)
+    presenter._download_client = SimpleNamespace(
+        stream=lambda method, url, headers=None: DummyStream()
+    )
+
+    result = asyncio.run(
+        presenter._download_manual_video_preview("https://cdn.example/video.mp4", job_id=3)
+    )
+
+    assert result is None
+    assert list(presenter.preview_storage_dir.iterdir()) == []
+
+
+def test_preview_index_skips_partial_downloads(tmp_path):
+    presenter = _create_presenter(tmp_path)
+    presenter.preview_storage_dir.mkdir(parents=True, exist_ok=True)
+    (presenter.preview_storage_dir / "job-5.mp4.part").write_bytes(b"partial")
+
+    assert presenter._find_local_preview(5) == (None, None)
+
+
 def test_should_download_media_filters_non_http():
     presenter = ManualVideoPresenter(templates=DummyTemplates())
 
@@ -147,10 +210,11 @@ def test_should_download_media_filters_non_http():
 
 def test_create_manual_video_dispatches_to_ai(monkeypatch, tmp_path):
     presenter = _create_presenter(tmp_path)
+    job_list_loads = []
     monkeypatch.setattr(
         manual_video_presenter.ManualVideoPresenter,
         "_load_recent_jobs",
-        lambda self, _db: ([], None),
+        lambda self, _db: job_list_loads.append(_db) or ([], None),
     )
 
     job = SimpleNamespace(id=55, media=[], campaign=None)
@@ -169,22 +233,18 @@ def test_create_manual_video_dispatches_to_ai(monkeypatch, tmp_path):
         )
 
     monkeypatch.setattr(manual_video_presenter, "dispatch_manual_video_job", fake_dispatch)
-    monkeypatch.setattr(
-        manual_video_presenter.ManualVideoPresenter,
-        "_should_download_media",
-        lambda self, _url: False,
-    )
-
-    request = SimpleNamespace(headers={})
+    request = SimpleNamespace(headers={}, state=SimpleNamespace())
     db = object()
     user = SimpleNamespace(id=7)
     ai_tool = presenter._ai_tools[0]
+    background_tasks = BackgroundTasks()
 
     response = asyncio.run(
         presenter.create_manual_video(
             request=request,
             db=db,
             user=user,
+            background_tasks=background_tasks,
             title="نمونه ویدیو",
             description="توضیحات",
             media_url="https://cdn.example/video.mp4",
@@ -205,3 +265,227 @@ def test_create_manual_video_dispatches_to_ai(monkeypatch, tmp_path):
     assert payload["ai_tool"] == ai_tool
     assert payload["submitted_by"] == user.id
     assert isinstance(response, RedirectResponse)
+    assert response.status_code == 302
+    assert job_list_loads == []
+    assert len(background_tasks.tasks) == 1
+    assert background_tasks.tasks[0].kwargs == {"job_id": job.id, "user_id": user.id}
+
+
+def test_jobs_for_request_loads_once_per_request(monkeypatch, tmp_path):
+    presenter = _create_presenter(tmp_path)
+    loads = []
+
+    def fake_load(self, _db):
+        loads.append(_db)
+        return [], None
+
+    monkeypatch.setattr(
+        manual_video_presenter.ManualVideoPresenter, "_load_recent_jobs", fake_load
+    )
+
+    request = SimpleNamespace(headers={}, state=SimpleNamespace())
+    first = presenter._jobs_for_request(request, object())
+    second = presenter._jobs_for_request(request, object())
+
+    assert first is second
+    assert len(loads) == 1
+
+
+def test_find_local_preview_matches_exact_job_id(tmp_path):
+    presenter = _create_presenter(tmp_path)
+    presenter.preview_storage_dir.mkdir(parents=True, exist_ok=True)
+    (presenter.preview_storage_dir / "job-42.mp4").write_bytes(b"preview")
+
+    assert presenter._find_local_preview(4) == (None, None)
+    url, _path = presenter._find_local_preview(42)
+    assert url == "/static/manual_videos/job-42.mp4"
+
+
+def test_create_manual_video_validation_error_loads_jobs_once(monkeypatch, tmp_path):
+    presenter = _create_presenter(tmp_path)
+    loads = []
+    monkeypatch.setattr(
+        manual_video_presenter.ManualVideoPresenter,
+        "_load_recent_jobs",
+        lambda self, _db: loads.append(_db) or ([], "warning"),
+    )
+
+    def failing_create(**_kwargs):
+        raise ValueError("Campaign requires a 'name'.")
+
+    monkeypatch.setattr(
+        manual_video_presenter, "create_job_with_media_and_campaign", failing_create
+    )
+
+    request = SimpleNamespace(
+        headers={"x-requested-with": "XMLHttpRequest"}, state=SimpleNamespace()
+    )
+    response = asyncio.run(
+        presenter.create_manual_video(
+            request=request,
+            db=object(),
+            user=SimpleNamespace(id=1),
+            background_tasks=BackgroundTasks(),
+            title="نمونه",
+            description=None,
+            media_url="https://cdn.example/video.mp4",
+            media_type=None,
+            campaign_name="کمپین",
+            campaign_description=None,
+            ai_tool=presenter._ai_tools[0],
+        )
+    )
+
+    assert response.status_code == 400
+    body = json.loads(response.body)
+    assert body["warning"] == "warning"
+    assert len(loads) == 1
+
+
+def test_create_manual_video_rejects_unknown_ai_tool(tmp_path, monkeypatch):
+    presenter = ManualVideoPresenter(
+        templates=DummyTemplates(),
+        static_root=tmp_path / "static",
+        preview_storage_dir=tmp_path / "static" / "manual_videos",
+        _ai_tools=("Runway",),
+    )
+    monkeypatch.setattr(
+        manual_video_presenter.ManualVideoPresenter,
+        "_load_recent_jobs",
+        lambda self, _db: ([], None),
+    )
+
+    def unexpected_create(**_kwargs):  # pragma: no cover - must not be reached
+        raise AssertionError("job should not be created")
+
+    monkeypatch.setattr(
+        manual_video_presenter, "create_job_with_media_and_campaign", unexpected_create
+    )
+
+    response = asyncio.run(
+        presenter.create_manual_video(
+            request=SimpleNamespace(
+                headers={"x-requested-with": "XMLHttpRequest"}, state=SimpleNamespace()
+            ),
+            db=object(),
+            user=SimpleNamespace(id=1),
+            background_tasks=BackgroundTasks(),
+            title="نمونه",
+            description=None,
+            media_url="https://cdn.example/video.mp4",
+            media_type=None,
+            campaign_name="کمپین",
+            campaign_description=None,
+            ai_tool="Pika",
+        )
+    )
+
+    assert presenter._ai_tool_set == frozenset({"Runway"})
+    assert response.status_code == 400
+
+
+def test_create_manual_video_renders_form_error_with_base_context(tmp_path, monkeypatch):
+    rendered = []
+    lookups = []
+
+    class RecordingTemplate:
+        def render(self, context):
+            rendered.append(context)
+            return "<html></html>"
+
+    class RecordingTemplates:
+        def get_template(self, name):
+            lookups.append(name)
+            return RecordingTemplate()
+
+    presenter = ManualVideoPresenter(
+        templates=RecordingTemplates(),
+        static_root=tmp_path / "static",
+        preview_storage_dir=tmp_path / "static" / "manual_videos",
+    )
+    monkeypatch.setattr(
+        manual_video_presenter.ManualVideoPresenter,
+        "_load_recent_jobs",
+        lambda self, _db: ([], "warning"),
+    )
+
+    def submit():
+        return asyncio.run(
+            presenter.create_manual_video(
+                request=SimpleNamespace(headers={}, state=SimpleNamespace()),
+                db=object(),
+                user=SimpleNamespace(id=1),
+                background_tasks=BackgroundTasks(),
+                title="",
+                description=None,
+                media_url="https://cdn.example/video.mp4",
+                media_type=None,
+                campaign_name="کمپین",
+                campaign_description=None,
+                ai_tool=presenter._ai_tools[0],
+            )
+        )
+
+    response = submit()
+    submit()
+
+    assert response.status_code == 400
+    assert response.body == b"<html></html>"
+    assert lookups == ["manual_video.html", "manual_video.html"]
+    context = rendered[0]
+    assert context["active_page"] == "manual_video"
+    assert context["ai_tools"] == presenter._ai_tools
+    assert context["error"] == "عنوان، لینک ویدیو و نام کمپین الزامی هستند."
+    assert context["load_error"] == "warning"
+
+
+def test_build_job_view_normalises_unexpected_status_casing(tmp_path):
+    presenter = _create_presenter(tmp_path)
+    job = SimpleNamespace(
+        id=None,
+        title="نمونه",
+        campaign=None,
+        status="  Completed ",
+        progress_percent=10,
+        created_at=None,
+        media=[],
+    )
+
+    view = presenter._build_job_view(job, local_preview=(None, None))
+
+    expected = manual_video_presenter.STATUS_PRESENTATIONS["completed"]
+    assert view.status_label == expected.label
+    assert view.progress_percent == 100
+
+
+def test_default_ai_tools_follow_the_ai_tool_enum(tmp_path):
+    from app.backend.ai_workflow import TOOLS, AITool
+
+    presenter = _create_presenter(tmp_path)
+
+    assert presenter._ai_tools == tuple(tool.name for tool in TOOLS)
+    assert presenter._ai_tool_set == frozenset(AITool)
+
+
+def test_normalize_manual_video_inputs_strips_and_defaults():
+    inputs = manual_video_presenter._normalize_manual_video_inputs(
+        " عنوان ", "", " https://cdn.example/v.mp4 ", "  ", " کمپین ", " شرح ", " Runway Gen-2 "
+    )
+
+    assert inputs == manual_video_presenter.ManualVideoInputs(
+        title="عنوان",
+        description=None,
+        media_url="https://cdn.example/v.mp4",
+        media_type="video/mp4",
+        campaign_name="کمپین",
+        campaign_description="شرح",
+        ai_tool="Runway Gen-2",
+    )
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [(None, 0), (-5, 0), (42, 42), (250, 100), ("63", 63), ("n/a", 0), (12.9, 12)],
+)
+def test_normalize_progress_coerces_and_clamps(raw, expected):
+    assert manual_video_presenter._normalize_progress(raw) == expected
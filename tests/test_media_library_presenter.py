@@ -0,0 +1,117 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pathlib
+import sys
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.ui.app_presenters import media_library_presenter
+from app.ui.app_presenters.media_library_presenter import MediaLibraryPresenter
+
+
+class DummyTemplates:
+    def TemplateResponse(self, *_args, **_kwargs):  # pragma: no cover - not used in tests
+        raise NotImplementedError
+
+
+def _media(**overrides):
+    values = {
+        "id": 7,
+        "job_name": None,
+        "media_type": "video/mp4",
+        "media_url": None,
+        "storage_key": None,
+        "storage_url": None,
+        "created_at": datetime(2024, 5, 1, 9, 7),
+        "job": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.mark.parametrize(
+    ("media_type", "preview_url", "expected"),
+    [
+        ("Video/MP4", None, "video"),
+        ("image/png", None, "image"),
+        ("audio/mpeg", None, "audio"),
+        ("", "https://cdn.example.com/clip.WEBM", "video"),
+        ("application/octet-stream", "/static/cover.jpeg", "image"),
+        ("", "/static/voice.m4a", "audio"),
+        ("", "/static/archive.zip", "other"),
+        ("", "https://cdn.example.com/stream", "other"),
+        ("", "mp4", "other"),
+        ("videos", None, "other"),
+        ("", None, "other"),
+    ],
+)
+def test_infer_category_uses_mime_type_then_url_suffix(media_type, preview_url, expected):
+    assert media_library_presenter._infer_category(media_type, preview_url) == expected
+
+
+def test_build_media_view_formats_row_for_template():
+    job = SimpleNamespace(
+        id=3,
+        title=" کلیپ معرفی ",
+        status="completed",
+        campaign=SimpleNamespace(name=" کمپین بهار "),
+    )
+    media = _media(
+        media_type="  image/png ",
+        storage_url=" /static/uploads/cover.png ",
+        job=job,
+    )
+
+    view = media_library_presenter._build_media_view(media)
+
+    assert view.media_type == "image/png"
+    assert view.category == "image"
+    assert view.preview_url == "/static/uploads/cover.png"
+    assert view.created_display == "2024-05-01 09:07"
+    assert view.title == "کلیپ معرفی"
+    assert view.job_id == 3
+    assert view.campaign_name == "کمپین بهار"
+    assert view.source_label == "ذخیره شده در فضای داخلی"
+
+
+def test_summarise_counts_each_category():
+    presenter = MediaLibraryPresenter(templates=DummyTemplates())
+    items = [
+        SimpleNamespace(category=category)
+        for category in ("video", "video", "image", "audio", "other", "other")
+    ]
+
+    summary = presenter._summarise(items)
+
+    assert (summary.total, summary.video, summary.image, summary.audio, summary.other) == (
+        6,
+        2,
+        1,
+        1,
+        2,
+    )
+
+
+def test_load_media_builds_views_from_sql_display_columns(monkeypatch):
+    rows = [
+        (_media(id=1, media_url="https://cdn.example.com/a.mp3"), "2024-05-02 18:30", "external"),
+        (_media(id=2, created_at=None), None, "none"),
+    ]
+    monkeypatch.setattr(
+        media_library_presenter.JobQueryService,
+        "list_recent_media_rows",
+        lambda self, *, limit: rows[:limit],
+    )
+    presenter = MediaLibraryPresenter(templates=DummyTemplates())
+
+    items, error = presenter._load_media(object())
+
+    assert error is None
+    assert [item.id for item in items] == [1, 2]
+    assert items[0].created_display == "2024-05-02 18:30"
+    assert items[0].source_label == "لینک خارجی ثبت‌شده"
+    assert items[1].created_display == ""
+    assert items[1].source_label == "بدون لینک ثبت‌شده"
@@ -0,0 +1,88 @@
+import pathlib
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.backend.database import Base, SessionLocal, engine
+from app.backend.models import ScheduledPost, SocialAccount
+from app.backend.services import ScheduledPostService
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def _seed_posts(count: int) -> None:
+    start = datetime(2024, 5, 1, 9, 0)
+    with SessionLocal() as session:
+        for index in range(count):
+            account = SocialAccount(platform="instagram", display_name=f"Account {index}")
+            session.add(account)
+            session.flush()
+            session.add(
+                ScheduledPost(
+                    account_id=account.id,
+                    title=f"Post {index}",
+                    scheduled_time=start + timedelta(hours=index),
+                )
+            )
+        session.commit()
+
+
+def test_list_recent_posts_loads_accounts_in_constant_queries():
+    _seed_posts(12)
+    statements: list[str] = []
+
+    def _count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    with SessionLocal() as session:
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            posts = ScheduledPostService(session).list_recent_posts()
+            names = [post.account.display_name for post in posts]
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+
+    assert names[0] == "Account 11"
+    assert len(names) == 12
+    assert len(statements) < 4
+
+
+def test_session_backed_services_carry_no_instance_dict():
+    with SessionLocal() as session:
+        service = ScheduledPostService(session)
+
+        assert service.session is session
+        assert not hasattr(service, "__dict__")
+
+
+def test_delete_post_issues_single_statement():
+    _seed_posts(2)
+    statements: list[str] = []
+
+    def _count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    with SessionLocal() as session:
+        service = ScheduledPostService(session)
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            deleted = service.delete_post(1)
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+        missing = service.delete_post(1)
+        remaining = [post.id for post in service.list_recent_posts()]
+
+    assert deleted is True
+    assert missing is False
+    assert remaining == [2]
+    assert len(statements) == 1
@@ -0,0 +1,222 @@
+import json
+import pathlib
+import sys
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.backend.database import Base, SessionLocal, engine
+from app.backend.models import ScheduledPost, SocialAccount
+from app.ui.app_presenters import helpers, scheduler_presenter
+from app.ui.app_presenters.helpers import FastJSONResponse
+from app.ui.app_presenters.scheduler_presenter import SchedulerPresenter
+
+
+class DummyTemplates:
+    def get_template(self, *_args, **_kwargs):  # pragma: no cover - not used in tests
+        raise NotImplementedError
+
+
+@pytest.fixture(autouse=True)
+def prepare_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def _seed_posts(count: int) -> None:
+    start = datetime(2024, 5, 1, 9, 0)
+    with SessionLocal() as session:
+        for index in range(count):
+            account = SocialAccount(platform="instagram", display_name=f"اکانت {index}")
+            session.add(account)
+            session.flush()
+            session.add(
+                ScheduledPost(
+                    account_id=account.id,
+                    title=f"پست {index}",
+                    scheduled_time=start + timedelta(hours=index),
+                )
+            )
+        session.commit()
+
+
+def test_load_scheduler_bundle_resolves_accounts_without_extra_queries():
+    _seed_posts(8)
+    presenter = SchedulerPresenter(templates=DummyTemplates())
+    statements: list[str] = []
+
+    def _count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    with SessionLocal() as session:
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            accounts, posts, load_error = presenter._load_scheduler_bundle(session)
+            account_names = [post.account.display_name for post in posts]
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+
+    assert load_error is None
+    assert len(accounts) == 8
+    assert account_names[:2] == ["اکانت 7", "اکانت 6"]
+    assert len(statements) == 2
+
+
+def test_create_schedule_rejects_invalid_timestamp_for_ajax():
+    _seed_posts(2)
+    presenter = SchedulerPresenter(templates=DummyTemplates())
+
+    with SessionLocal() as session:
+        response = presenter.create_schedule(
+            request=SimpleNamespace(headers={"x-requested-with": "XMLHttpRequest"}),
+            db=session,
+            user=SimpleNamespace(id=1),
+            account_id=1,
+            title="پست",
+            content=None,
+            video_url=None,
+            scheduled_time="not-a-date",
+        )
+
+    assert response.status_code == 400
+    body = json.loads(response.body)
+    assert body["success"] is False
+    assert body["error"] == "فرمت تاریخ/زمان نامعتبر است."
+    assert [post["id"] for post in body["posts"]] == [2, 1]
+    assert "warning" not in body
+
+
+def test_posts_payload_bytes_match_stdlib_encoder():
+    _seed_posts(3)
+    presenter = SchedulerPresenter(templates=DummyTemplates())
+
+    with SessionLocal() as session:
+        response = presenter._posts_payload(session, success=True, status_code=200, message="ثبت شد")
+
+    assert isinstance(response, FastJSONResponse)
+    assert response.body == JSONResponse(json.loads(response.body)).body
+    assert "ثبت شد".encode() in response.body
+
+
+def test_ajax_delete_serialises_posts_from_column_rows():
+    _seed_posts(3)
+    with SessionLocal() as session:
+        session.add(ScheduledPost(account_id=99, title="بدون حساب", scheduled_time=datetime(2020, 1, 1)))
+        session.commit()
+    presenter = SchedulerPresenter(templates=DummyTemplates())
+    statements: list[str] = []
+
+    def _count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    with SessionLocal() as session:
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            response = presenter.delete_schedule(
+                request=SimpleNamespace(headers={"x-requested-with": "XMLHttpRequest"}),
+                db=session,
+                user=SimpleNamespace(id=1),
+                post_id=1,
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+
+    body = json.loads(response.body)
+    assert response.status_code == 200
+    assert body["message"] == "پست زمان‌بندی شده حذف شد."
+    assert body["posts"][0] == {
+        "id": 3,
+        "title": "پست 2",
+        "account": "اکانت 2",
+        "account_platform": "instagram",
+        "scheduled_time": "2024-05-01T11:00:00",
+        "scheduled_time_display": "2024-05-01 11:00",
+        "status": "pending",
+        "video_url": "",
+        "content": "",
+    }
+    assert [post["account"] for post in body["posts"]][-1] == "-"
+    assert len(body["posts"]) == 3
+    assert sum(statement.lstrip().upper().startswith("SELECT") for statement in statements) == 1
+
+
+def test_format_schedule_display_keeps_zone_specific_output():
+    naive = datetime(2024, 5, 20, 14, 45)
+    utc = datetime(2024, 5, 20, 14, 45, tzinfo=timezone.utc)
+    tehran = utc.astimezone(timezone(timedelta(hours=3, minutes=30)))
+
+    assert scheduler_presenter._format_schedule_display(naive) == "2024-05-20 14:45"
+    assert scheduler_presenter._format_schedule_display(utc) == "2024-05-20 14:45"
+    assert scheduler_presenter._format_schedule_display(tehran) == "2024-05-20 18:15"
+
+
+def test_payload_encoding_matches_stdlib_fallback(monkeypatch):
+    payload = {
+        "posts": [
+            scheduler_presenter.ScheduledPostPayload(
+                id=1,
+                title="پست",
+                account="-",
+                account_platform="",
+                scheduled_time=datetime(2024, 5, 20, 14, 45, 30, 120000),
+                scheduled_time_display="2024-05-20 14:45",
+                status="pending",
+                video_url="",
+                content="",
+            )
+        ]
+    }
+    fast = FastJSONResponse(payload).body
+    monkeypatch.setattr(helpers, "orjson", None)
+
+    assert FastJSONResponse(payload).body == fast
+    assert json.loads(fast)["posts"][0]["scheduled_time"] == "2024-05-20T14:45:30.120000"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [datetime(2024, 1, 2, 3, 4), datetime(2030, 12, 31, 23, 59), datetime(2024, 11, 30, 0, 0, 59)],
+)
+def test_format_schedule_display_matches_strftime(value):
+    assert scheduler_presenter._format_schedule_display(value) == value.strftime("%Y-%m-%d %H:%M")
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"), [(None, None), ("", None), ("   ", None), (" متن ", "متن")]
+)
+def test_norm_strips_optional_fields(raw, expected):
+    assert scheduler_presenter._norm(raw) == expected
+
+
+@pytest.mark.parametrize(
+    ("messages", "expected"),
+    [((None, None), None), (("خطا", None), "خطا"), (("الف", "ب", "الف", ""), "الف ب")],
+)
+def test_join_errors_dedupes_in_order(messages, expected):
+    assert helpers.join_errors(*messages) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("2024-05-20T14:45", datetime(2024, 5, 20, 14, 45)),
+        (" 2024-05-20 14:45:30Z ", datetime(2024, 5, 20, 14, 45, 30)),
+        ("2024-05-20", datetime(2024, 5, 20)),
+        (
+            "2024-05-20T14:45:00.5+03:30",
+            datetime(2024, 5, 20, 14, 45, 0, 500000, tzinfo=timezone(timedelta(hours=3, minutes=30))),
+        ),
+        ("not-a-date", None),
+        ("2024-13-20T14:45", None),
+        ("", None),
+    ],
+)
+def test_parse_schedule_time(raw, expected):
+    assert scheduler_presenter._parse_schedule_time(raw) == expected
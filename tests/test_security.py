@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import os
 import pathlib
@@ -5,7 +6,7 @@ import sys
 
 import pytest
 from fastapi import HTTPException
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from starlette.requests import Request
 
@@ -15,6 +16,8 @@ from app.backend import auth, models
 from app.backend.database import Base
 from app.backend.security import crypto
 from app.backend.services import permissions as permissions_service
+from app.backend.services.data_access import ServiceTokenService
+from app.ui.views.dependencies import login_required
 
 
 @pytest.fixture(autouse=True)
@@ -181,3 +184,81 @@ def test_missing_key_file_is_created(tmp_path, monkeypatch):
     stored_key = key_path.read_bytes().strip()
     assert stored_key
     assert crypto.decrypt_value(encrypted) == "hello-world"
+
+
+def test_apply_permission_updates_batches_writes(session_factory):
+    session = session_factory()
+    try:
+        permissions_service.ensure_default_permissions(session)
+        statements: list[tuple[str, bool]] = []
+
+        def _record(_conn, _cursor, statement, _params, _context, executemany):
+            statements.append((statement.split()[0], executemany))
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            permissions_service.apply_permission_updates(
+                session, permissions_service.parse_permission_updates({})
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert statements == [("SELECT", False), ("UPDATE", True)]
+        matrix = permissions_service.get_permission_matrix(session)
+        assert not any(matrix[models.AdminRole.VIEWER.value].values())
+    finally:
+        session.close()
+
+
+def test_list_tokens_defers_value_decryption(session_factory, monkeypatch):
+    session = session_factory()
+    try:
+        for index in range(3):
+            session.add(models.ServiceToken(name=f"Token {index}", key=f"key-{index}", value=f"secret-{index}"))
+        session.commit()
+        session.expunge_all()
+
+        decrypted: list[str] = []
+        original_decrypt = models.decrypt_value
+
+        def _recording_decrypt(value):
+            decrypted.append(value)
+            return original_decrypt(value)
+
+        monkeypatch.setattr(models, "decrypt_value", _recording_decrypt)
+        tokens = ServiceTokenService(session).list_tokens()
+
+        assert [token.key for token in tokens] and decrypted == []
+        assert {token.value for token in tokens} == {"secret-0", "secret-1", "secret-2"}
+        assert len(decrypted) == 3
+    finally:
+        session.close()
+
+
+def test_login_required_redirects_anonymous_requests(session_factory):
+    session = session_factory()
+    try:
+        permissions_service.ensure_default_permissions(session)
+        viewer = models.AdminUser(
+            username="viewer-dep",
+            password_hash="dummy-hash",
+            role=models.AdminRole.VIEWER,
+        )
+        session.add(viewer)
+        session.commit()
+        dependency = login_required(required_menu=models.AdminMenu.DASHBOARD)
+
+        def _request(session_data: dict) -> Request:
+            return Request(
+                {"type": "http", "method": "GET", "path": "/", "headers": [], "session": session_data}
+            )
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(dependency(_request({}), session))
+
+        assert exc_info.value.status_code == 302
+        assert exc_info.value.headers == {"Location": "/login"}
+        assert asyncio.run(dependency(_request({"user_id": viewer.id}), session)) is viewer
+    finally:
+        session.close()
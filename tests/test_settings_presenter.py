@@ -0,0 +1,95 @@
+import json
+import pathlib
+import sys
+from types import SimpleNamespace
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+from app.backend.services.data_access import DatabaseServiceError, ServiceTokenService
+from app.ui.app_presenters.settings_presenter import SettingsPresenter
+
+
+class RecordingTemplates:
+    def __init__(self):
+        self.rendered = []
+
+    def get_template(self, name):
+        templates = self
+
+        class _Template:
+            def render(self, context):
+                templates.rendered.append((name, context))
+                return "<html></html>"
+
+        return _Template()
+
+
+def _failing_upsert(self, **_kwargs):
+    raise DatabaseServiceError()
+
+
+def _save_token(presenter, headers):
+    return presenter.save_token(
+        request=SimpleNamespace(headers=headers),
+        db=object(),
+        user=SimpleNamespace(id=1),
+        name="OpenAI",
+        key="openai",
+        value="secret",
+        endpoint_url=None,
+    )
+
+
+def test_save_token_failure_renders_settings_with_error(monkeypatch):
+    monkeypatch.setattr(ServiceTokenService, "upsert_token", _failing_upsert)
+    monkeypatch.setattr(ServiceTokenService, "list_tokens", lambda self: [])
+    templates = RecordingTemplates()
+    presenter = SettingsPresenter(templates=templates)
+
+    response = _save_token(presenter, headers={})
+
+    assert response.status_code == 500
+    [(name, context)] = templates.rendered
+    assert name == "settings.html"
+    assert context["active_page"] == "settings"
+    assert context["tokens"] == []
+    assert context["error"] == "ذخیره توکن با خطا مواجه شد."
+    assert "load_error" not in context
+
+
+def test_save_token_failure_returns_json_warning_for_ajax(monkeypatch):
+    def _failing_list(self):
+        raise DatabaseServiceError()
+
+    monkeypatch.setattr(ServiceTokenService, "upsert_token", _failing_upsert)
+    monkeypatch.setattr(ServiceTokenService, "list_tokens", _failing_list)
+    templates = RecordingTemplates()
+    presenter = SettingsPresenter(templates=templates)
+
+    response = _save_token(presenter, headers={"x-requested-with": "XMLHttpRequest"})
+
+    assert response.status_code == 500
+    assert json.loads(response.body) == {
+        "success": False,
+        "error": "ذخیره توکن با خطا مواجه شد.",
+        "warning": "بارگذاری توکن‌ها با خطا مواجه شد.",
+    }
+    assert templates.rendered == []
+
+
+def test_save_token_failure_reuses_one_service(monkeypatch):
+    created = []
+    original_init = ServiceTokenService.__init__
+
+    def _recording_init(self, session):
+        created.append(session)
+        original_init(self, session)
+
+    monkeypatch.setattr(ServiceTokenService, "__init__", _recording_init)
+    monkeypatch.setattr(ServiceTokenService, "upsert_token", _failing_upsert)
+    monkeypatch.setattr(ServiceTokenService, "list_tokens", lambda self: [])
+    presenter = SettingsPresenter(templates=RecordingTemplates())
+
+    _save_token(presenter, headers={})
+
+    assert len(created) == 1
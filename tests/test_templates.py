@@ -80,3 +80,26 @@ def test_logs_template_renders_entries():
     assert "abc123.log" in html
     assert "job_started" in html
     assert "badge-info" in html
+
+
+def test_page_template_picks_up_template_edits(tmp_path):
+    import os
+
+    from fastapi.templating import Jinja2Templates
+
+    from app.ui.app_presenters.helpers import PageTemplate
+
+    source = tmp_path / "page.html"
+    source.write_text("<p>{{ message }}</p>", encoding="utf-8")
+    templates = Jinja2Templates(directory=str(tmp_path))
+    page = PageTemplate(templates, "page.html")
+
+    first = page.render({"message": "سلام"})
+    source.write_text("<div>{{ message }}</div>", encoding="utf-8")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = page.render({"message": "خطا"}, status_code=500)
+
+    assert (first.status_code, first.body.decode()) == (200, "<p>سلام</p>")
+    assert (second.status_code, second.body.decode()) == (500, "<div>خطا</div>")
+    assert second.headers["content-type"] == "text/html; charset=utf-8"
@@ -1,6 +1,7 @@
 import logging
 import pathlib
 import sys
+from datetime import datetime
 from types import SimpleNamespace
 
 import pytest
@@ -15,6 +16,7 @@ from app.backend.services.text_graphy import (
     TextGraphyPlan,
     TextGraphyProcessingStage,
 )
+from app.ui.app_presenters import text_graphy_presenter
 from app.ui.app_presenters.text_graphy_presenter import (
     TextGraphyPresenter,
     TextGraphyTokenUsage,
@@ -25,9 +27,15 @@ class DummyTemplates:
     def __init__(self):
         self.calls = []
 
-    def TemplateResponse(self, request, template_name, context, **_kwargs):
-        self.calls.append((template_name, context))
-        return context
+    def get_template(self, template_name):
+        calls = self.calls
+
+        class _Template:
+            def render(self, context):
+                calls.append((template_name, context))
+                return ""
+
+        return _Template()
 
 
 class StubTextGraphyService:
@@ -112,6 +120,7 @@ def test_create_text_graphy_renders_context(sample_plan, tmp_path):
     assert rendered_context["token_usage"]
     assert rendered_context["token_label"] == "FakeTranslator"
     assert rendered_context["token_usage"][0].is_active is True
+    assert rendered_context["token_usage"] is rendered_context["form_state"].token_usage
     downloads = rendered_context["result"].get("downloads")
     assert downloads
     assert downloads["webvtt_url"].startswith("/static/test-downloads")
@@ -127,6 +136,57 @@ def test_create_text_graphy_renders_context(sample_plan, tmp_path):
     assert call["audio_duration"] == pytest.approx(80.0)
 
 
+def test_create_text_graphy_serialises_plan_once(sample_plan, tmp_path, monkeypatch):
+    counts = {"as_webvtt": 0, "lines_json": 0}
+    for name in counts:
+        original = getattr(TextGraphyPlan, name)
+
+        def _counting(plan, _name=name, _original=original):
+            counts[_name] += 1
+            return _original(plan)
+
+        monkeypatch.setattr(TextGraphyPlan, name, _counting)
+    templates = DummyTemplates()
+    presenter = TextGraphyPresenter(templates, StubTextGraphyService(sample_plan))
+    presenter.download_storage_dir = tmp_path
+
+    presenter.create_text_graphy(
+        request=SimpleNamespace(),
+        user=SimpleNamespace(),
+        coverr_reference="sample",
+        music_url=None,
+        music_duration="8",
+        lyrics_text="Line 1\nLine 2",
+    )
+
+    result = templates.calls[-1][1]["result"]
+    assert counts == {"as_webvtt": 1, "lines_json": 1}
+    assert pathlib.Path(result["downloads"]["webvtt_path"]).read_text(encoding="utf-8") == result["webvtt"]
+    assert pathlib.Path(result["downloads"]["lines_json_path"]).read_text(encoding="utf-8") == result["lines_json"]
+
+
+def test_create_text_graphy_without_persist_skips_artifacts(sample_plan, tmp_path):
+    templates = DummyTemplates()
+    presenter = TextGraphyPresenter(templates, StubTextGraphyService(sample_plan))
+    presenter.download_storage_dir = tmp_path / "downloads"
+
+    presenter.create_text_graphy(
+        request=SimpleNamespace(),
+        user=SimpleNamespace(),
+        coverr_reference="sample",
+        music_url=None,
+        music_duration="8",
+        lyrics_text="Line 1\nLine 2",
+        persist=False,
+    )
+
+    result = templates.calls[-1][1]["result"]
+    assert "downloads" not in result
+    assert result["webvtt"].startswith("WEBVTT")
+    assert result["lines_json"]
+    assert not presenter.download_storage_dir.exists()
+
+
 def test_create_text_graphy_with_invalid_duration_sets_error(sample_plan):
     templates = DummyTemplates()
     service = StubTextGraphyService(sample_plan)
@@ -150,6 +210,23 @@ def test_create_text_graphy_with_invalid_duration_sets_error(sample_plan):
     assert service.calls == []
 
 
+def test_render_shares_default_state_without_mutating_it():
+    templates = DummyTemplates()
+    presenter = TextGraphyPresenter(templates, StubTextGraphyService(None))
+    tokens = [TextGraphyTokenUsage(name="Coverr", key="coverr_api", is_active=True)]
+
+    presenter.render(SimpleNamespace(), SimpleNamespace(), token_usage=tokens)
+    presenter.render(SimpleNamespace(), SimpleNamespace(), token_usage=[])
+
+    (_, with_tokens), (_, without_tokens) = templates.calls
+    assert with_tokens["form_state"] is without_tokens["form_state"]
+    assert with_tokens["token_usage"] == tuple(tokens)
+    assert with_tokens["token_hint"] == "توکن‌های فعال از بخش تنظیمات بارگذاری شده‌اند."
+    assert without_tokens["token_usage"] == ()
+    assert without_tokens["token_hint"] is None
+    assert with_tokens["form_state"].token_usage is None
+
+
 def test_parse_duration_formats():
     templates = DummyTemplates()
     # The service is not used for this test; create a dummy stub.
@@ -159,8 +236,47 @@ def test_parse_duration_formats():
     assert presenter._parse_duration("01:30") == pytest.approx(90.0)
     assert presenter._parse_duration("01:02:03") == pytest.approx(3723.0)
 
-    with pytest.raises(ValueError):
-        presenter._parse_duration("01:02:03:04")
+    assert presenter._parse_duration("01:30,5") == pytest.approx(90.5)
+    assert presenter._parse_duration(" 2.25 ") == pytest.approx(2.25)
+    assert presenter._parse_duration("02:00") == 120.0
+    assert presenter._parse_duration(".5") == pytest.approx(0.5)
+    assert presenter._parse_duration("5.") == pytest.approx(5.0)
+    assert presenter._parse_duration("01:,5") == pytest.approx(60.5)
+    assert presenter._parse_duration("۰۲:۳۰") == 150.0
+    assert presenter._parse_duration("   ") is None
+    assert presenter._parse_duration(None) is None
+
+    for invalid in ("01:02:03:04", "abc", "1:", "-5", "1e3", ".", "1:.", "inf"):
+        with pytest.raises(ValueError):
+            presenter._parse_duration(invalid)
+
+
+def test_persist_plan_artifacts_skips_taken_names(sample_plan, tmp_path, monkeypatch):
+    fixed = datetime(2024, 5, 20, 14, 45, 0).timetuple()
+    monkeypatch.setattr(text_graphy_presenter.time, "gmtime", lambda: fixed)
+    (tmp_path / "sample-20240520144500.vtt").write_text("taken", encoding="utf-8")
+    presenter = TextGraphyPresenter(DummyTemplates(), StubTextGraphyService(sample_plan))
+    presenter.download_storage_dir = tmp_path
+
+    downloads = presenter._persist_plan_artifacts(sample_plan, webvtt="WEBVTT", lines_json="[]")
+
+    assert downloads.webvtt_path.name == "sample-20240520144500-1.vtt"
+    assert downloads.lines_json_path.name == "sample-20240520144500.json"
+    assert downloads.webvtt_path.read_text(encoding="utf-8") == "WEBVTT"
+    assert (tmp_path / "sample-20240520144500.vtt").read_text(encoding="utf-8") == "taken"
+
+
+@pytest.mark.parametrize(
+    ("identifier", "expected"),
+    [
+        ("Sunset Over/The Lake", "sunset-over-the-lake"),
+        ("  غروب دریا!! ", "غروب-دریا"),
+        ("--", "text-graphy"),
+        (None, "text-graphy"),
+    ],
+)
+def test_sanitize_identifier(identifier, expected):
+    assert TextGraphyPresenter._sanitize_identifier(identifier) == expected
 
 
 def test_presenter_exception_metadata_reports_origin():
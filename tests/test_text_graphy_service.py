@@ -7,10 +7,14 @@ import pytest
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 
+from app.backend.services import text_graphy
 from app.backend.services.text_graphy import (
     CoverrAPIError,
+    CoverrVideoMetadata,
     CoverrVideoSource,
     LyricsProcessingError,
+    TextGraphyLine,
+    TextGraphyPlan,
     TextGraphyService,
     TextGraphyDiagnostics,
 )
@@ -289,3 +293,25 @@ def test_fetch_coverr_exhaustive_fallback_to_slug_query():
     assert any(url.startswith("https://coverr.co/api/v3/videos?slug=") for url in urls)
     assert urls[-1].startswith("https://coverr.co/api/videos?slug=")
     assert video.identifier == payload["id"]
+
+
+def test_lines_json_matches_stdlib_fallback(monkeypatch):
+    plan = TextGraphyPlan(
+        video=CoverrVideoMetadata(
+            identifier="sample",
+            title="Sample",
+            thumbnail_url="https://coverr.example/thumb.jpg",
+            preview_url=None,
+            sources=(),
+        ),
+        lines=(TextGraphyLine(index=0, original="Line", translated="خط", start=0.0, end=2.5),),
+        audio_url=None,
+        total_duration=2.5,
+    )
+    encoded = plan.lines_json()
+    monkeypatch.setattr(text_graphy, "orjson", None)
+
+    assert plan.lines_json() == encoded
+    assert json.loads(encoded) == [
+        {"index": 0, "original": "Line", "translated": "خط", "start": 0.0, "end": 2.5}
+    ]